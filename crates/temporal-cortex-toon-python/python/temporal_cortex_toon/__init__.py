@@ -1,74 +1,203 @@
 """temporal_cortex_toon — TOON codec + Truth Engine for Python.
 
 This module re-exports the native Rust extension and wraps
-``merge_availability`` with a one-time informational hint when called
-with 3+ event streams (suppressable via ``TEMPORAL_CORTEX_QUIET`` env var).
+``merge_availability`` (and ``merge_availability_many``) with a one-time
+informational hint when called with 3+ event streams (suppressable via ``TEMPORAL_CORTEX_QUIET`` env var).
 """
 
-import json
-import logging
+from __future__ import annotations
+
 import os
 
 from temporal_cortex_toon._native import (
+    FilterSet,
+    clear_caches,
     decode,
+    decode_bytes,
     encode,
+    encode_bytes,
+    encode_many,
     expand_rrule,
+    expand_rrule_bytes,
     filter_and_encode,
+    filter_and_encode_bytes,
     find_first_free_across,
     convert_timezone,
     compute_duration,
     adjust_timestamp,
     resolve_relative,
     resolve_relative_with_options,
+    set_caches_enabled,
 )
 from temporal_cortex_toon._native import (
+    HINT_ENABLED as _HINT_ENABLED,
+    _hint_flag,
     merge_availability as _native_merge_availability,
+    merge_availability_bytes as _native_merge_availability_bytes,
+    merge_availability_many as _native_merge_availability_many,
+    merge_availability_with_hint as _native_merge_availability_with_hint,
 )
 
 __all__ = [
+    "FilterSet",
+    "clear_caches",
     "decode",
+    "decode_bytes",
     "encode",
+    "encode_bytes",
+    "encode_many",
     "expand_rrule",
+    "expand_rrule_bytes",
     "filter_and_encode",
+    "filter_and_encode_bytes",
     "find_first_free_across",
     "merge_availability",
+    "merge_availability_many",
     "convert_timezone",
     "compute_duration",
     "adjust_timestamp",
     "resolve_relative",
     "resolve_relative_with_options",
+    "set_caches_enabled",
 ]
 
-_hint_shown = False
+# Wheels built with the ``no-hint`` Cargo feature compile the hint out;
+# merges then always go straight to the native call.
+_quiet = not _HINT_ENABLED or bool(os.environ.get("TEMPORAL_CORTEX_QUIET"))
 
-_logger = logging.getLogger("temporal_cortex_toon")
+_HINT_MSG = (
+    "Merging 3+ calendars? Temporal Cortex Platform adds "
+    "live connectors, booking safety & policy rules. "
+    "https://app.temporal-cortex.com"
+)
 
+# Created on first hint; ``logging`` is only imported if the hint fires.
+_logger = None
 
-def merge_availability(
+
+def _hint_logger():
+    """Return the hint's logger adapter, importing ``logging`` on first use.
+
+    The adapter carries fixed ``extra`` context, so structured fields can be
+    added to the hint without per-call formatting work.
+    """
+    global _logger
+
+    if _logger is None:
+        import logging
+
+        _logger = logging.LoggerAdapter(
+            logging.getLogger("temporal_cortex_toon"), {"component": "merge_hint"}
+        )
+    return _logger
+
+
+def _merge_with_hint(
     streams_json: str,
     window_start: str,
     window_end: str,
+    opaque: bool,
+    *,
+    _native=_native_merge_availability_with_hint,
+    _flag=_hint_flag,
+) -> str:
+    """Slow path: merge via the native hint-aware call and log the hint once.
+
+    The stream count and the one-shot ``_hint_flag`` both live in Rust, so
+    the hint fires exactly once even under free-threaded CPython. Once it
+    has fired, ``_merge_impl`` is rebound to the plain native merge so later
+    calls skip the check entirely. The keyword-only defaults bind module
+    globals as locals (``LOAD_FAST`` instead of a module-dict lookup).
+    """
+    result, multi_stream = _native(streams_json, window_start, window_end, opaque)
+    if multi_stream and _flag.try_fire():
+        _fire_hint()
+    return result
+
+
+def _maybe_hint(multi_stream: bool) -> None:
+    """Fire the one-time hint for merges that bypass ``_merge_impl``."""
+    if multi_stream and not _quiet and _hint_flag.try_fire():
+        _fire_hint()
+
+
+def _fire_hint() -> None:
+    """Log the one-time hint and route later merges straight to native."""
+    global _merge_impl
+
+    _merge_impl = _native_merge_availability
+
+    import logging
+
+    adapter = _hint_logger()
+    logger = adapter.logger
+    if logger.isEnabledFor(logging.INFO):
+        # The message is fixed, so hand over a ready-made record and skip
+        # Logger.info()'s caller lookup (a stack walk) and %-formatting.
+        record = logger.makeRecord(
+            logger.name, logging.INFO, __file__, 0, _HINT_MSG, (), None,
+            extra=adapter.extra,
+        )
+        logger.handle(record)
+
+
+_merge_impl = _native_merge_availability if _quiet else _merge_with_hint
+
+
+def _refresh_quiet() -> None:
+    """Re-read ``TEMPORAL_CORTEX_QUIET`` (normally read once at import).
+
+    For tests that toggle the env var after the module has been imported.
+    """
+    global _quiet, _merge_impl
+
+    _quiet = not _HINT_ENABLED or bool(os.environ.get("TEMPORAL_CORTEX_QUIET"))
+    _merge_impl = _native_merge_availability if _quiet else _merge_with_hint
+
+
+def _reset_hint() -> None:
+    """Re-arm the one-time hint and re-read ``TEMPORAL_CORTEX_QUIET``."""
+    _hint_flag.reset()
+    _refresh_quiet()
+
+
+def merge_availability(
+    streams_json: str | bytes,
+    window_start: str,
+    window_end: str,
     opaque: bool = True,
 ) -> str:
     """Merge N event streams into unified availability.
 
-    Delegates to the native Rust implementation. On first call with 3+
-    streams, emits a one-time INFO log about the Temporal Cortex Platform
-    (suppressable via ``TEMPORAL_CORTEX_QUIET`` environment variable).
+    Delegates to the native Rust implementation. ``streams_json`` may also
+    be UTF-8 ``bytes`` (e.g., an HTTP response body), which skips building
+    a ``str`` first. On first call with 3+ streams, emits a one-time INFO
+    log about the Temporal Cortex Platform (suppressable via
+    ``TEMPORAL_CORTEX_QUIET`` environment variable, read once at import).
+    """
+    if isinstance(streams_json, bytes):
+        result, multi_stream = _native_merge_availability_bytes(
+            streams_json, window_start, window_end, opaque
+        )
+        _maybe_hint(multi_stream)
+        return result
+    return _merge_impl(streams_json, window_start, window_end, opaque)
+
+
+def merge_availability_many(
+    streams_json: str,
+    windows: list[tuple[str, str]],
+    opaque: bool = True,
+) -> list[str]:
+    """Merge N event streams against several time windows in one native call.
+
+    Equivalent to calling ``merge_availability`` once per
+    ``(window_start, window_end)`` pair, but ``streams_json`` is parsed once
+    and the GIL is released for the whole batch. The one-time hint applies
+    as for ``merge_availability``.
     """
-    global _hint_shown
-
-    if not _hint_shown and not os.environ.get("TEMPORAL_CORTEX_QUIET"):
-        try:
-            streams = json.loads(streams_json)
-            if isinstance(streams, list) and len(streams) >= 3:
-                _hint_shown = True
-                _logger.info(
-                    "Merging 3+ calendars? Temporal Cortex Platform adds "
-                    "live connectors, booking safety & policy rules. "
-                    "https://app.temporal-cortex.com"
-                )
-        except (json.JSONDecodeError, TypeError):
-            pass  # Never let hint logic interfere with the actual call
-
-    return _native_merge_availability(streams_json, window_start, window_end, opaque)
+    results, multi_stream = _native_merge_availability_many(
+        streams_json, windows, opaque
+    )
+    _maybe_hint(multi_stream)
+    return results
@@ -0,0 +1,146 @@
+//! Small bounded LRU cache shared by the bindings.
+//!
+//! Capacities are tiny (tens of entries), so a linear scan over a `VecDeque`
+//! beats a hash map + linked list and needs no extra dependencies. Values are
+//! handed out as `Arc`s so callers can use them after the lock is released.
+
+use std::collections::VecDeque;
+use std::sync::{Arc, Mutex, MutexGuard, PoisonError};
+
+/// A least-recently-used cache holding at most `capacity` entries.
+///
+/// The most recently used entry sits at the front of the deque.
+pub(crate) struct LruCache<K, V> {
+    capacity: usize,
+    entries: VecDeque<(K, Arc<V>)>,
+}
+
+impl<K, V> LruCache<K, V> {
+    /// Create an empty cache. `const` so it can back a `static Mutex`.
+    pub(crate) const fn new(capacity: usize) -> Self {
+        Self {
+            capacity,
+            entries: VecDeque::new(),
+        }
+    }
+
+    /// Look up the first entry whose key satisfies `matches`, marking it as
+    /// most recently used.
+    ///
+    /// Takes a predicate rather than `&K` so callers can compare against
+    /// borrowed data without building an owned key for every lookup.
+    pub(crate) fn get_by(&mut self, matches: impl Fn(&K) -> bool) -> Option<Arc<V>> {
+        let idx = self.entries.iter().position(|(k, _)| matches(k))?;
+        let entry = self.entries.remove(idx)?;
+        let value = Arc::clone(&entry.1);
+        self.entries.push_front(entry);
+        Some(value)
+    }
+
+    /// Insert an entry as most recently used, evicting the oldest if full.
+    pub(crate) fn insert(&mut self, key: K, value: Arc<V>) {
+        if self.capacity == 0 {
+            return;
+        }
+        if self.entries.len() == self.capacity {
+            self.entries.pop_back();
+        }
+        self.entries.push_front((key, value));
+    }
+
+    /// Drop every entry.
+    pub(crate) fn clear(&mut self) {
+        self.entries.clear();
+    }
+}
+
+/// Lock a cache, recovering from poisoning (a panic mid-update can at worst
+/// leave a stale-but-valid entry behind).
+pub(crate) fn lock<T>(cache: &Mutex<T>) -> MutexGuard<'_, T> {
+    cache.lock().unwrap_or_else(PoisonError::into_inner)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn get(cache: &mut LruCache<u32, &'static str>, key: u32) -> Option<&'static str> {
+        cache.get_by(|k| *k == key).map(|v| *v)
+    }
+
+    #[test]
+    fn test_get_returns_inserted_value() {
+        let mut cache = LruCache::new(2);
+        cache.insert(1, Arc::new("one"));
+        assert_eq!(get(&mut cache, 1), Some("one"));
+        assert_eq!(get(&mut cache, 2), None);
+    }
+
+    #[test]
+    fn test_insert_evicts_least_recently_inserted() {
+        let mut cache = LruCache::new(2);
+        cache.insert(1, Arc::new("one"));
+        cache.insert(2, Arc::new("two"));
+        cache.insert(3, Arc::new("three"));
+        assert_eq!(get(&mut cache, 1), None);
+        assert_eq!(get(&mut cache, 2), Some("two"));
+        assert_eq!(get(&mut cache, 3), Some("three"));
+    }
+
+    #[test]
+    fn test_get_promotes_entry_past_eviction() {
+        let mut cache = LruCache::new(2);
+        cache.insert(1, Arc::new("one"));
+        cache.insert(2, Arc::new("two"));
+        // Touching 1 makes 2 the least recently used.
+        assert_eq!(get(&mut cache, 1), Some("one"));
+        cache.insert(3, Arc::new("three"));
+        assert_eq!(get(&mut cache, 2), None);
+        assert_eq!(get(&mut cache, 1), Some("one"));
+        assert_eq!(get(&mut cache, 3), Some("three"));
+    }
+
+    #[test]
+    fn test_clear_drops_all_entries() {
+        let mut cache = LruCache::new(2);
+        cache.insert(1, Arc::new("one"));
+        cache.insert(2, Arc::new("two"));
+        cache.clear();
+        assert_eq!(get(&mut cache, 1), None);
+        assert_eq!(get(&mut cache, 2), None);
+    }
+
+    #[test]
+    fn test_zero_capacity_stores_nothing() {
+        let mut cache = LruCache::new(0);
+        cache.insert(1, Arc::new("one"));
+        assert_eq!(get(&mut cache, 1), None);
+    }
+
+    #[test]
+    fn test_hash_collision_compares_payload() {
+        // Keys shaped like the stream cache's `(hash, payload)`: an equal
+        // hash with a different payload must miss.
+        let mut cache: LruCache<(u64, Box<str>), u32> = LruCache::new(2);
+        cache.insert((7, "[1]".into()), Arc::new(1));
+        let lookup = |cache: &mut LruCache<(u64, Box<str>), u32>, json: &str| {
+            cache
+                .get_by(|(h, payload)| *h == 7 && &**payload == json)
+                .map(|v| *v)
+        };
+        assert_eq!(lookup(&mut cache, "[2]"), None);
+        assert_eq!(lookup(&mut cache, "[1]"), Some(1));
+    }
+
+    #[test]
+    fn test_lock_recovers_from_poison() {
+        let cache = Mutex::new(LruCache::<u32, u32>::new(1));
+        let _ = std::panic::catch_unwind(|| {
+            let _guard = cache.lock().unwrap();
+            panic!("poison");
+        });
+        assert!(cache.is_poisoned());
+        lock(&cache).insert(1, Arc::new(1));
+        assert_eq!(lock(&cache).get_by(|k| *k == 1).map(|v| *v), Some(1));
+    }
+}
@@ -7,11 +7,34 @@
 //!
 //! - `encode(json)` -- JSON string -> TOON string
 //! - `decode(toon)` -- TOON string -> JSON string
+//! - `encode_bytes(json)` / `decode_bytes(toon)` -- same, on UTF-8 `bytes`
+//! - `encode_many(jsons)` -- batch `encode` with one GIL release
 //! - `filter_and_encode(json, patterns)` -- semantic filter + TOON encode
+//! - `filter_and_encode_bytes(json, patterns)` -- same, on UTF-8 `bytes`
+//! - `FilterSet(patterns).apply(json)` -- reusable filter + TOON encode
 //! - `expand_rrule(...)` -- RRULE expansion -> JSON string of events
+//! - `expand_rrule_bytes(...)` -- RRULE expansion -> packed epoch-nanosecond pairs
+//! - `clear_caches()` / `set_caches_enabled(enabled)` -- manage the result caches
 
+mod cache;
+
+use std::cell::RefCell;
+use std::hash::{DefaultHasher, Hash, Hasher};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, Mutex};
+
+use chrono::{DateTime, Datelike, NaiveDateTime, Timelike, Utc};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyDict, PyList, PyString};
+use truth_engine::availability::{EventStream, PrivacyLevel};
+use truth_engine::expander::ExpandedEvent;
+
+use cache::LruCache;
+
+#[cfg(feature = "mimalloc")]
+#[global_allocator]
+static GLOBAL: mimalloc::MiMalloc = mimalloc::MiMalloc;
 
 /// Encode a JSON string into TOON format.
 ///
@@ -24,8 +47,65 @@
 /// Raises:
 ///     ValueError: If the input is not valid JSON or encoding fails.
 #[pyfunction]
-fn encode(json: &str) -> PyResult<String> {
-    toon_core::encode(json).map_err(|e| PyValueError::new_err(e.to_string()))
+fn encode<'py>(py: Python<'py>, json: &str) -> PyResult<Bound<'py, PyString>> {
+    with_scratch(|buf| {
+        py.detach(|| toon_core::encode_into(json, buf))
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        Ok(PyString::new(py, buf))
+    })
+}
+
+/// Encode several JSON strings into TOON in one call.
+///
+/// The whole batch is encoded with the GIL released once, so per-call
+/// boundary overhead is paid once per batch instead of once per payload.
+///
+/// Args:
+///     jsons: List of valid JSON strings.
+///
+/// Returns:
+///     One TOON-encoded string per input, in order.
+///
+/// Raises:
+///     ValueError: If any input is not valid JSON or encoding fails; the
+///         message names the index of the offending item.
+#[pyfunction]
+fn encode_many(py: Python<'_>, jsons: Vec<String>) -> PyResult<Vec<String>> {
+    py.detach(|| {
+        jsons
+            .iter()
+            .enumerate()
+            .map(|(i, json)| {
+                toon_core::encode(json)
+                    .map_err(|e| PyValueError::new_err(format!("item {}: {}", i, e)))
+            })
+            .collect()
+    })
+}
+
+/// Scratch buffers larger than this are freed after use instead of kept.
+const SCRATCH_RETAIN: usize = 64 * 1024;
+
+thread_local! {
+    /// Per-thread output buffer for `encode`: the result is copied into a
+    /// Python `str` anyway, so reusing the buffer saves an allocation per call.
+    static SCRATCH: RefCell<String> = const { RefCell::new(String::new()) };
+}
+
+/// Run `f` with this thread's cleared scratch buffer.
+fn with_scratch<R>(f: impl FnOnce(&mut String) -> R) -> R {
+    SCRATCH.with(|cell| match cell.try_borrow_mut() {
+        Ok(mut buf) => {
+            buf.clear();
+            let result = f(&mut buf);
+            if buf.capacity() > SCRATCH_RETAIN {
+                *buf = String::new();
+            }
+            result
+        }
+        // Re-entered while in use (e.g., from a finalizer): use a fresh buffer.
+        Err(_) => f(&mut String::new()),
+    })
 }
 
 /// Decode a TOON string back into JSON.
@@ -39,8 +119,52 @@ fn encode(json: &str) -> PyResult<String> {
 /// Raises:
 ///     ValueError: If the input is not valid TOON or decoding fails.
 #[pyfunction]
-fn decode(toon: &str) -> PyResult<String> {
-    toon_core::decode(toon).map_err(|e| PyValueError::new_err(e.to_string()))
+fn decode(py: Python<'_>, toon: &str) -> PyResult<String> {
+    py.detach(|| toon_core::decode(toon).map_err(|e| PyValueError::new_err(e.to_string())))
+}
+
+/// Borrow UTF-8 input bytes as `&str`, raising `ValueError` if they aren't valid UTF-8.
+fn utf8(data: &[u8]) -> PyResult<&str> {
+    std::str::from_utf8(data).map_err(|e| PyValueError::new_err(format!("Invalid UTF-8: {}", e)))
+}
+
+/// Encode UTF-8 JSON bytes into TOON, returned as UTF-8 bytes.
+///
+/// Same as `encode`, but for callers that already hold `bytes` (e.g., an
+/// HTTP response body): no `str` has to be built on the way in or out.
+///
+/// Args:
+///     data: UTF-8 encoded JSON.
+///
+/// Returns:
+///     The TOON-encoded output as UTF-8 bytes.
+///
+/// Raises:
+///     ValueError: If the input is not valid UTF-8 or JSON, or encoding fails.
+#[pyfunction]
+fn encode_bytes<'py>(py: Python<'py>, data: &[u8]) -> PyResult<Bound<'py, PyBytes>> {
+    let toon = py.detach(|| {
+        toon_core::encode_slice(data).map_err(|e| PyValueError::new_err(e.to_string()))
+    })?;
+    Ok(PyBytes::new(py, toon.as_bytes()))
+}
+
+/// Decode UTF-8 TOON bytes back into JSON, returned as UTF-8 bytes.
+///
+/// Args:
+///     data: UTF-8 encoded TOON.
+///
+/// Returns:
+///     The JSON output as UTF-8 bytes.
+///
+/// Raises:
+///     ValueError: If the input is not valid UTF-8 or TOON, or decoding fails.
+#[pyfunction]
+fn decode_bytes<'py>(py: Python<'py>, data: &[u8]) -> PyResult<Bound<'py, PyBytes>> {
+    let json = py.detach(|| {
+        toon_core::decode(utf8(data)?).map_err(|e| PyValueError::new_err(e.to_string()))
+    })?;
+    Ok(PyBytes::new(py, json.as_bytes()))
 }
 
 /// Filter fields from a JSON string by pattern, then encode to TOON.
@@ -60,10 +184,106 @@ fn decode(toon: &str) -> PyResult<String> {
 /// Raises:
 ///     ValueError: If the input is not valid JSON or encoding fails.
 #[pyfunction]
-fn filter_and_encode(json: &str, patterns: Vec<String>) -> PyResult<String> {
-    let pattern_refs: Vec<&str> = patterns.iter().map(|s| s.as_str()).collect();
-    toon_core::filter_and_encode(json, &pattern_refs)
-        .map_err(|e| PyValueError::new_err(e.to_string()))
+fn filter_and_encode(py: Python<'_>, json: &str, patterns: Vec<String>) -> PyResult<String> {
+    py.detach(|| {
+        let pattern_refs: Vec<&str> = patterns.iter().map(|s| s.as_str()).collect();
+        toon_core::filter_and_encode(json, &pattern_refs)
+            .map_err(|e| PyValueError::new_err(e.to_string()))
+    })
+}
+
+/// Filter fields from UTF-8 JSON bytes by pattern, then encode to TOON bytes.
+///
+/// Same as `filter_and_encode`, but for callers that already hold `bytes`
+/// (e.g., a calendar API response body): no `str` is built on the way in or out.
+///
+/// Args:
+///     data: UTF-8 encoded JSON.
+///     patterns: A list of field patterns to strip.
+///
+/// Returns:
+///     The filtered TOON-encoded output as UTF-8 bytes.
+///
+/// Raises:
+///     ValueError: If the input is not valid UTF-8 or JSON, or encoding fails.
+#[pyfunction]
+fn filter_and_encode_bytes<'py>(
+    py: Python<'py>,
+    data: &[u8],
+    patterns: Vec<String>,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let toon = py.detach(|| {
+        let pattern_refs: Vec<&str> = patterns.iter().map(|s| s.as_str()).collect();
+        toon_core::FilterSet::new(&pattern_refs)
+            .filter_and_encode_slice(data)
+            .map_err(|e| PyValueError::new_err(e.to_string()))
+    })?;
+    Ok(PyBytes::new(py, toon.as_bytes()))
+}
+
+/// A reusable set of field patterns for semantic filtering + TOON encoding.
+///
+/// Parses the patterns once so `apply()` can be called on many JSON strings
+/// (e.g., every page of a calendar sync) without re-parsing them. Pattern
+/// syntax is the same as `filter_and_encode`.
+///
+/// Args:
+///     patterns: A list of field patterns to strip.
+///
+/// Example:
+///     fs = FilterSet(["etag", "*.kind"])
+///     toon = fs.apply(json_str)
+#[pyclass(frozen, module = "temporal_cortex_toon")]
+struct FilterSet {
+    inner: toon_core::FilterSet,
+}
+
+#[pymethods]
+impl FilterSet {
+    #[new]
+    fn new(patterns: Vec<String>) -> Self {
+        let pattern_refs: Vec<&str> = patterns.iter().map(|s| s.as_str()).collect();
+        Self {
+            inner: toon_core::FilterSet::new(&pattern_refs),
+        }
+    }
+
+    /// Filter fields from a JSON string, then encode to TOON.
+    ///
+    /// Args:
+    ///     json: A valid JSON string.
+    ///
+    /// Returns:
+    ///     The filtered TOON-encoded string.
+    ///
+    /// Raises:
+    ///     ValueError: If the input is not valid JSON or encoding fails.
+    fn apply(&self, py: Python<'_>, json: &str) -> PyResult<String> {
+        py.detach(|| {
+            self.inner
+                .filter_and_encode(json)
+                .map_err(|e| PyValueError::new_err(e.to_string()))
+        })
+    }
+
+    /// Same as `apply`, but takes and returns UTF-8 `bytes`.
+    ///
+    /// Args:
+    ///     data: UTF-8 encoded JSON.
+    ///
+    /// Returns:
+    ///     The filtered TOON-encoded output as UTF-8 bytes.
+    ///
+    /// Raises:
+    ///     ValueError: If the input is not valid UTF-8 or JSON, or encoding fails.
+    fn apply_bytes<'py>(&self, py: Python<'py>, data: &[u8]) -> PyResult<Bound<'py, PyBytes>> {
+        let toon = py.detach(|| {
+            self.inner
+                .filter_and_encode_slice(data)
+                .map_err(|e| PyValueError::new_err(e.to_string()))
+        })?;
+        Ok(PyBytes::new(py, toon.as_bytes()))
+    }
 }
 
 /// Expand an RRULE into concrete event instances, returned as a JSON string.
@@ -78,105 +298,292 @@ fn filter_and_encode(json: &str, patterns: Vec<String>) -> PyResult<String> {
 ///     timezone: IANA timezone identifier (e.g., "America/Los_Angeles").
 ///     until: Optional end boundary for expansion (local datetime string).
 ///     max_count: Optional maximum number of instances to generate.
+///     as_json: If False, return the events as a list of dicts instead of a
+///         JSON string, skipping the `json.loads` round trip. Default: True.
 ///
 /// Returns:
-///     A JSON string containing an array of event objects with `start` and `end` fields.
+///     A JSON string containing an array of event objects with `start` and `end`
+///     fields, or (with `as_json=False`) the equivalent `list[dict[str, str]]`.
 ///
 /// Raises:
 ///     ValueError: If the RRULE or timezone is invalid.
 #[pyfunction]
-#[pyo3(signature = (rrule, dtstart, duration_minutes, timezone, until=None, max_count=None))]
-fn expand_rrule(
+#[pyo3(signature = (rrule, dtstart, duration_minutes, timezone, until=None, max_count=None, as_json=true))]
+#[allow(clippy::too_many_arguments)]
+fn expand_rrule<'py>(
+    py: Python<'py>,
     rrule: &str,
     dtstart: &str,
     duration_minutes: i64,
     timezone: &str,
     until: Option<&str>,
     max_count: Option<u32>,
-) -> PyResult<String> {
-    let events = truth_engine::expand_rrule(
-        rrule,
-        dtstart,
-        duration_minutes as u32,
-        timezone,
-        until,
-        max_count,
-    )
-    .map_err(|e| PyValueError::new_err(e.to_string()))?;
+    as_json: bool,
+) -> PyResult<Bound<'py, PyAny>> {
+    if as_json {
+        let json = py.detach(|| {
+            expand(rrule, dtstart, duration_minutes, timezone, until, max_count)
+                .map(|events| events_json(&events))
+        })?;
+        return Ok(PyString::new(py, &json).into_any());
+    }
 
-    // Serialize to JSON: [{"start": "...", "end": "..."}, ...]
-    let json_events: Vec<serde_json::Value> = events
-        .into_iter()
-        .map(|evt| {
-            serde_json::json!({
-                "start": evt.start.to_rfc3339(),
-                "end": evt.end.to_rfc3339(),
-            })
+    let events =
+        py.detach(|| expand(rrule, dtstart, duration_minutes, timezone, until, max_count))?;
+    let list = PyList::empty(py);
+    let mut buf = String::with_capacity(32);
+    for evt in events.iter() {
+        let dict = PyDict::new(py);
+        buf.clear();
+        write_rfc3339(&mut buf, evt.start);
+        dict.set_item(pyo3::intern!(py, "start"), buf.as_str())?;
+        buf.clear();
+        write_rfc3339(&mut buf, evt.end);
+        dict.set_item(pyo3::intern!(py, "end"), buf.as_str())?;
+        list.append(dict)?;
+    }
+    Ok(list.into_any())
+}
+
+/// Length of one `{"start":"...","end":"..."}` entry with whole-second timestamps.
+const EVENT_JSON_LEN: usize = 71;
+
+/// Serialize events as `[{"start": "...", "end": "..."}, ...]` straight into
+/// one buffer, with no intermediate `serde_json::Value` or per-timestamp
+/// `String`. The timestamps need no JSON escaping.
+fn events_json(events: &[ExpandedEvent]) -> String {
+    let mut out = String::with_capacity(2 + events.len() * (EVENT_JSON_LEN + 1));
+    out.push('[');
+    for (i, evt) in events.iter().enumerate() {
+        if i > 0 {
+            out.push(',');
+        }
+        out.push_str(r#"{"start":""#);
+        write_rfc3339(&mut out, evt.start);
+        out.push_str(r#"","end":""#);
+        write_rfc3339(&mut out, evt.end);
+        out.push_str(r#""}"#);
+    }
+    out.push(']');
+    out
+}
+
+/// Append `dt` exactly as `DateTime::to_rfc3339` formats it.
+///
+/// Whole-second timestamps in years 0-9999 -- every RRULE instance in
+/// practice -- are written digit by digit into a stack buffer; anything else
+/// (fractional seconds, leap seconds, extended years) defers to chrono.
+fn write_rfc3339(out: &mut String, dt: DateTime<Utc>) {
+    let (date, time) = (dt.date_naive(), dt.time());
+    let Ok(year) = u32::try_from(date.year()) else {
+        out.push_str(&dt.to_rfc3339());
+        return;
+    };
+    if year > 9999 || time.nanosecond() != 0 {
+        out.push_str(&dt.to_rfc3339());
+        return;
+    }
+
+    let mut buf = *b"0000-00-00T00:00:00+00:00";
+    put_digits(&mut buf[0..4], year);
+    put_digits(&mut buf[5..7], date.month());
+    put_digits(&mut buf[8..10], date.day());
+    put_digits(&mut buf[11..13], time.hour());
+    put_digits(&mut buf[14..16], time.minute());
+    put_digits(&mut buf[17..19], time.second());
+    out.push_str(std::str::from_utf8(&buf).expect("RFC 3339 buffer is ASCII"));
+}
+
+/// Write `n` as zero-padded decimal digits filling `slot`.
+fn put_digits(slot: &mut [u8], mut n: u32) {
+    for digit in slot.iter_mut().rev() {
+        *digit = b'0' + (n % 10) as u8;
+        n /= 10;
+    }
+}
+
+/// How many distinct RRULE expansions keep their result cached.
+const EXPANSION_CACHE_CAPACITY: usize = 32;
+
+/// Expansions with more events than this are returned but not cached, which
+/// bounds the cache to `EXPANSION_CACHE_CAPACITY * EXPANSION_CACHE_MAX_EVENTS`
+/// events (about 750 KiB) however large `max_count` gets.
+const EXPANSION_CACHE_MAX_EVENTS: usize = 1000;
+
+/// The full set of `expand_rrule` arguments an expansion depends on.
+struct ExpansionKey {
+    rrule: Box<str>,
+    dtstart: Box<str>,
+    duration_minutes: i64,
+    timezone: Box<str>,
+    until: Option<Box<str>>,
+    max_count: Option<u32>,
+}
+
+static EXPANSION_CACHE: Mutex<LruCache<ExpansionKey, Vec<ExpandedEvent>>> =
+    Mutex::new(LruCache::new(EXPANSION_CACHE_CAPACITY));
+
+/// Expand an RRULE, mapping engine errors to `ValueError`.
+///
+/// Results are cached by their exact arguments: agents tend to expand the
+/// same few recurring events over and over, and a hit skips RRULE parsing,
+/// timezone lookup and expansion entirely. Errors are not cached, and
+/// nothing is cached while `set_caches_enabled(False)` is in effect.
+fn expand(
+    rrule: &str,
+    dtstart: &str,
+    duration_minutes: i64,
+    timezone: &str,
+    until: Option<&str>,
+    max_count: Option<u32>,
+) -> PyResult<Arc<Vec<ExpandedEvent>>> {
+    let caching = CACHES_ENABLED.load(Ordering::Relaxed);
+    let cached = caching.then(|| {
+        cache::lock(&EXPANSION_CACHE).get_by(|key| {
+            &*key.rrule == rrule
+                && &*key.dtstart == dtstart
+                && key.duration_minutes == duration_minutes
+                && &*key.timezone == timezone
+                && key.until.as_deref() == until
+                && key.max_count == max_count
         })
-        .collect();
+    });
+    if let Some(events) = cached.flatten() {
+        return Ok(events);
+    }
 
-    serde_json::to_string(&json_events).map_err(|e| PyValueError::new_err(e.to_string()))
+    let events = Arc::new(
+        truth_engine::expand_rrule(
+            rrule,
+            dtstart,
+            duration_minutes as u32,
+            timezone,
+            until,
+            max_count,
+        )
+        .map_err(|e| PyValueError::new_err(e.to_string()))?,
+    );
+    if !caching || events.len() > EXPANSION_CACHE_MAX_EVENTS {
+        return Ok(events);
+    }
+    let key = ExpansionKey {
+        rrule: rrule.into(),
+        dtstart: dtstart.into(),
+        duration_minutes,
+        timezone: timezone.into(),
+        until: until.map(Into::into),
+        max_count,
+    };
+    cache::lock(&EXPANSION_CACHE).insert(key, Arc::clone(&events));
+    Ok(events)
 }
 
-/// Merge N event streams into unified availability within a time window.
+/// Expand an RRULE into packed `(start, end)` pairs of UTC epoch nanoseconds.
 ///
-/// Args:
-///     streams_json: JSON array of stream objects, each with `stream_id` (str) and
-///         `events` (array of `{start, end}` objects with ISO 8601 strings).
-///     window_start: Start of the time window (ISO 8601 datetime string).
-///     window_end: End of the time window (ISO 8601 datetime string).
-///     opaque: If True, hide source counts in busy blocks (privacy mode). Default: True.
+/// Same arguments as `expand_rrule`, but skips formatting and re-parsing
+/// timestamps: each event is two little-endian `int64` values, so the result
+/// loads straight into NumPy with
+/// `np.frombuffer(buf, dtype="<i8").reshape(-1, 2)`.
 ///
 /// Returns:
-///     A JSON string with `{busy, free, window_start, window_end, privacy}`.
+///     `bytes` of length `16 * number_of_events`.
 ///
 /// Raises:
-///     ValueError: If the JSON input is malformed or datetimes are invalid.
+///     ValueError: If the RRULE or timezone is invalid, or an instance falls
+///         outside the nanosecond range (years 1677-2262).
 #[pyfunction]
-#[pyo3(signature = (streams_json, window_start, window_end, opaque=true))]
-fn merge_availability(
-    streams_json: &str,
-    window_start: &str,
-    window_end: &str,
-    opaque: bool,
-) -> PyResult<String> {
-    use chrono::{DateTime, NaiveDateTime, Utc};
-    use truth_engine::availability::{EventStream, PrivacyLevel};
-    use truth_engine::expander::ExpandedEvent;
-
-    #[derive(serde::Deserialize)]
-    struct StreamInput {
-        stream_id: String,
-        events: Vec<EventInput>,
+#[pyo3(signature = (rrule, dtstart, duration_minutes, timezone, until=None, max_count=None))]
+fn expand_rrule_bytes<'py>(
+    py: Python<'py>,
+    rrule: &str,
+    dtstart: &str,
+    duration_minutes: i64,
+    timezone: &str,
+    until: Option<&str>,
+    max_count: Option<u32>,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let packed = py.detach(|| {
+        let events = expand(rrule, dtstart, duration_minutes, timezone, until, max_count)?;
+        pack_epoch_nanos(&events)
+    })?;
+    Ok(PyBytes::new(py, &packed))
+}
+
+/// Pack events as little-endian `i64` `(start, end)` epoch-nanosecond pairs.
+fn pack_epoch_nanos(events: &[ExpandedEvent]) -> PyResult<Vec<u8>> {
+    let mut packed = Vec::with_capacity(events.len() * 16);
+    for evt in events {
+        for dt in [evt.start, evt.end] {
+            let nanos = dt.timestamp_nanos_opt().ok_or_else(|| {
+                PyValueError::new_err(format!("{} is out of nanosecond range", dt))
+            })?;
+            packed.extend_from_slice(&nanos.to_le_bytes());
+        }
     }
-    #[derive(serde::Deserialize)]
-    struct EventInput {
-        start: String,
-        end: String,
+    Ok(packed)
+}
+
+/// Minimum number of streams that triggers the one-time Platform hint.
+const HINT_MIN_STREAMS: usize = 3;
+
+/// One-shot flag guarding the Platform hint, exposed as `_native._hint_flag`.
+///
+/// Backed by an `AtomicBool` so check-and-set is a single compare-exchange,
+/// which stays correct under free-threaded CPython.
+#[pyclass(frozen, module = "temporal_cortex_toon._native")]
+#[derive(Default)]
+struct HintFlag {
+    fired: AtomicBool,
+}
+
+#[pymethods]
+impl HintFlag {
+    #[new]
+    fn new() -> Self {
+        Self::default()
     }
 
-    fn parse_dt(s: &str) -> PyResult<DateTime<Utc>> {
-        if let Ok(dt) = DateTime::parse_from_rfc3339(s) {
-            return Ok(dt.with_timezone(&Utc));
-        }
-        NaiveDateTime::parse_from_str(s, "%Y-%m-%dT%H:%M:%S")
-            .map(|ndt| ndt.and_utc())
-            .map_err(|e| PyValueError::new_err(format!("Invalid datetime '{}': {}", s, e)))
+    /// Return True for the first caller only; False until `reset()` is called.
+    fn try_fire(&self) -> bool {
+        self.fired
+            .compare_exchange(false, true, Ordering::AcqRel, Ordering::Relaxed)
+            .is_ok()
     }
 
-    let inputs: Vec<StreamInput> = serde_json::from_str(streams_json)
-        .map_err(|e| PyValueError::new_err(format!("Invalid streams JSON: {}", e)))?;
+    /// Re-arm the flag (used by the Python test suite).
+    fn reset(&self) {
+        self.fired.store(false, Ordering::Release);
+    }
+}
 
-    let ws = parse_dt(window_start)?;
-    let we = parse_dt(window_end)?;
+#[derive(serde::Deserialize)]
+struct StreamInput {
+    stream_id: String,
+    events: Vec<EventInput>,
+}
 
-    let privacy = if opaque {
-        PrivacyLevel::Opaque
-    } else {
-        PrivacyLevel::Full
-    };
+#[derive(serde::Deserialize)]
+struct EventInput {
+    start: String,
+    end: String,
+}
 
-    let streams: Vec<EventStream> = inputs
+/// Parse an RFC 3339 datetime, falling back to a naive `%Y-%m-%dT%H:%M:%S` as UTC.
+fn parse_dt(s: &str) -> PyResult<DateTime<Utc>> {
+    if let Ok(dt) = DateTime::parse_from_rfc3339(s) {
+        return Ok(dt.with_timezone(&Utc));
+    }
+    NaiveDateTime::parse_from_str(s, "%Y-%m-%dT%H:%M:%S")
+        .map(|ndt| ndt.and_utc())
+        .map_err(|e| PyValueError::new_err(format!("Invalid datetime '{}': {}", s, e)))
+}
+
+/// Parse a `streams_json` payload into truth-engine event streams.
+fn parse_streams(streams_json: &str) -> PyResult<Vec<EventStream>> {
+    let inputs: Vec<StreamInput> = serde_json::from_str(streams_json)
+        .map_err(|e| PyValueError::new_err(format!("Invalid streams JSON: {}", e)))?;
+
+    inputs
         .into_iter()
         .map(|si| {
             let events: PyResult<Vec<ExpandedEvent>> = si
@@ -193,14 +600,219 @@ fn parse_dt(s: &str) -> PyResult<DateTime<Utc>> {
                 events: events?,
             })
         })
-        .collect::<PyResult<Vec<_>>>()?;
+        .collect()
+}
+
+/// How many distinct `streams_json` payloads keep their parsed form cached.
+const STREAM_CACHE_CAPACITY: usize = 8;
+
+/// Parsed streams keyed by `(hash, payload)`. The hash rejects most misses
+/// cheaply; comparing the payload rules out collisions.
+type StreamCache = LruCache<(u64, Box<str>), Vec<EventStream>>;
+
+static STREAM_CACHE: Mutex<StreamCache> = Mutex::new(LruCache::new(STREAM_CACHE_CAPACITY));
 
-    let result = truth_engine::merge_availability(&streams, ws, we, privacy);
+/// Payloads larger than this are parsed on every call instead of cached.
+/// Hashing and copying big payloads costs more than a hit saves, and the
+/// cap bounds the cache to `STREAM_CACHE_CAPACITY` payloads of this size
+/// plus their parsed form.
+const STREAM_CACHE_MAX_BYTES: usize = 64 * 1024;
+
+/// Whether the stream and expansion caches are used; see `set_caches_enabled`.
+static CACHES_ENABLED: AtomicBool = AtomicBool::new(true);
+
+/// Drop every cached `streams_json` payload and RRULE expansion.
+///
+/// The caches keep calendar data alive for the life of the process; call
+/// this to release it (e.g., when a user's session ends).
+#[pyfunction]
+fn clear_caches() {
+    cache::lock(&STREAM_CACHE).clear();
+    cache::lock(&EXPANSION_CACHE).clear();
+}
+
+/// Turn the parsed-streams and RRULE expansion caches on or off.
+///
+/// Disabling also clears them. Useful for workloads that never repeat a
+/// payload, where caching only adds a hash and a copy per call.
+///
+/// Args:
+///     enabled: Whether later calls may read and fill the caches.
+#[pyfunction]
+fn set_caches_enabled(enabled: bool) {
+    CACHES_ENABLED.store(enabled, Ordering::Relaxed);
+    if !enabled {
+        clear_caches();
+    }
+}
+
+/// Parse `streams_json`, reusing the result of an earlier call with the same payload.
+///
+/// Server workloads often merge one user's streams against many windows
+/// ("free today?", "free this week?"); this skips the JSON and datetime
+/// parsing for every call after the first.
+fn cached_streams(streams_json: &str) -> PyResult<Arc<Vec<EventStream>>> {
+    // "No calendars connected yet" is common; skip hashing, locking and
+    // evicting a useful cache entry for it. Only JSON whitespace is trimmed,
+    // so anything serde would reject still raises.
+    if streams_json.trim_matches([' ', '\t', '\n', '\r']) == "[]" {
+        return Ok(Arc::new(Vec::new()));
+    }
+    if streams_json.len() > STREAM_CACHE_MAX_BYTES || !CACHES_ENABLED.load(Ordering::Relaxed) {
+        return parse_streams(streams_json).map(Arc::new);
+    }
+
+    let mut hasher = DefaultHasher::new();
+    streams_json.hash(&mut hasher);
+    let hash = hasher.finish();
+
+    let cached =
+        cache::lock(&STREAM_CACHE).get_by(|(h, json)| *h == hash && &**json == streams_json);
+    if let Some(streams) = cached {
+        return Ok(streams);
+    }
+
+    let streams = Arc::new(parse_streams(streams_json)?);
+    cache::lock(&STREAM_CACHE).insert((hash, streams_json.into()), Arc::clone(&streams));
+    Ok(streams)
+}
+
+/// Merge parsed streams within a window and serialize the result to JSON.
+fn merge_streams(
+    streams: &[EventStream],
+    window_start: &str,
+    window_end: &str,
+    opaque: bool,
+) -> PyResult<String> {
+    let ws = parse_dt(window_start)?;
+    let we = parse_dt(window_end)?;
+
+    let privacy = if opaque {
+        PrivacyLevel::Opaque
+    } else {
+        PrivacyLevel::Full
+    };
+
+    let result = truth_engine::merge_availability(streams, ws, we, privacy);
 
     serde_json::to_string(&result)
         .map_err(|e| PyValueError::new_err(format!("Serialization error: {}", e)))
 }
 
+/// Merge N event streams into unified availability within a time window.
+///
+/// Args:
+///     streams_json: JSON array of stream objects, each with `stream_id` (str) and
+///         `events` (array of `{start, end}` objects with ISO 8601 strings).
+///     window_start: Start of the time window (ISO 8601 datetime string).
+///     window_end: End of the time window (ISO 8601 datetime string).
+///     opaque: If True, hide source counts in busy blocks (privacy mode). Default: True.
+///
+/// Returns:
+///     A JSON string with `{busy, free, window_start, window_end, privacy}`.
+///
+/// Raises:
+///     ValueError: If the JSON input is malformed or datetimes are invalid.
+#[pyfunction]
+#[pyo3(signature = (streams_json, window_start, window_end, opaque=true))]
+fn merge_availability(
+    py: Python<'_>,
+    streams_json: &str,
+    window_start: &str,
+    window_end: &str,
+    opaque: bool,
+) -> PyResult<String> {
+    py.detach(|| {
+        let streams = cached_streams(streams_json)?;
+        merge_streams(&streams, window_start, window_end, opaque)
+    })
+}
+
+/// Like `merge_availability`, but also reports whether 3+ streams were merged.
+///
+/// The stream count comes from the parse the merge already does, so the
+/// Python wrapper never has to inspect `streams_json` itself. Pair with
+/// `_hint_flag.try_fire()` to show the Platform hint once per process.
+///
+/// Returns:
+///     A `(json, multi_stream)` tuple.
+///
+/// Raises:
+///     ValueError: If the JSON input is malformed or datetimes are invalid.
+#[pyfunction]
+#[pyo3(signature = (streams_json, window_start, window_end, opaque=true))]
+fn merge_availability_with_hint(
+    py: Python<'_>,
+    streams_json: &str,
+    window_start: &str,
+    window_end: &str,
+    opaque: bool,
+) -> PyResult<(String, bool)> {
+    py.detach(|| {
+        let streams = cached_streams(streams_json)?;
+        let json = merge_streams(&streams, window_start, window_end, opaque)?;
+        Ok((json, streams.len() >= HINT_MIN_STREAMS))
+    })
+}
+
+/// `merge_availability_with_hint` for a `streams_json` payload given as UTF-8 bytes.
+///
+/// Returns:
+///     A `(json, multi_stream)` tuple.
+///
+/// Raises:
+///     ValueError: If the input is not valid UTF-8 or JSON, or datetimes are invalid.
+#[pyfunction]
+#[pyo3(signature = (streams_json, window_start, window_end, opaque=true))]
+fn merge_availability_bytes(
+    py: Python<'_>,
+    streams_json: &[u8],
+    window_start: &str,
+    window_end: &str,
+    opaque: bool,
+) -> PyResult<(String, bool)> {
+    py.detach(|| {
+        let streams = cached_streams(utf8(streams_json)?)?;
+        let json = merge_streams(&streams, window_start, window_end, opaque)?;
+        Ok((json, streams.len() >= HINT_MIN_STREAMS))
+    })
+}
+
+/// Merge N event streams against several time windows in one call.
+///
+/// Parses `streams_json` once and reuses it for every window, with the GIL
+/// released for the whole batch. Prefer this over calling
+/// `merge_availability` in a loop (e.g., one window per day).
+///
+/// Args:
+///     streams_json: JSON array of stream objects (same format as merge_availability).
+///     windows: List of `(window_start, window_end)` ISO 8601 datetime string pairs.
+///     opaque: If True, hide source counts in busy blocks (privacy mode). Default: True.
+///
+/// Returns:
+///     A `(results, multi_stream)` tuple: one JSON string per window (same
+///     format as merge_availability), and whether 3+ streams were merged.
+///
+/// Raises:
+///     ValueError: If the JSON input is malformed or any datetime is invalid.
+#[pyfunction]
+#[pyo3(signature = (streams_json, windows, opaque=true))]
+fn merge_availability_many(
+    py: Python<'_>,
+    streams_json: &str,
+    windows: Vec<(String, String)>,
+    opaque: bool,
+) -> PyResult<(Vec<String>, bool)> {
+    py.detach(|| {
+        let streams = cached_streams(streams_json)?;
+        let results = windows
+            .iter()
+            .map(|(ws, we)| merge_streams(&streams, ws, we, opaque))
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok((results, streams.len() >= HINT_MIN_STREAMS))
+    })
+}
+
 /// Find the first free slot of at least `min_duration_minutes` across N merged
 /// event streams.
 ///
@@ -217,67 +829,25 @@ fn parse_dt(s: &str) -> PyResult<DateTime<Utc>> {
 ///     ValueError: If the JSON input is malformed or datetimes are invalid.
 #[pyfunction]
 fn find_first_free_across(
+    py: Python<'_>,
     streams_json: &str,
     window_start: &str,
     window_end: &str,
     min_duration_minutes: i64,
 ) -> PyResult<String> {
-    use chrono::{DateTime, NaiveDateTime, Utc};
-    use truth_engine::availability::EventStream;
-    use truth_engine::expander::ExpandedEvent;
-
-    #[derive(serde::Deserialize)]
-    struct StreamInput {
-        stream_id: String,
-        events: Vec<EventInput>,
-    }
-    #[derive(serde::Deserialize)]
-    struct EventInput {
-        start: String,
-        end: String,
-    }
+    py.detach(|| {
+        let streams = cached_streams(streams_json)?;
+        let ws = parse_dt(window_start)?;
+        let we = parse_dt(window_end)?;
 
-    fn parse_dt(s: &str) -> PyResult<DateTime<Utc>> {
-        if let Ok(dt) = DateTime::parse_from_rfc3339(s) {
-            return Ok(dt.with_timezone(&Utc));
-        }
-        NaiveDateTime::parse_from_str(s, "%Y-%m-%dT%H:%M:%S")
-            .map(|ndt| ndt.and_utc())
-            .map_err(|e| PyValueError::new_err(format!("Invalid datetime '{}': {}", s, e)))
-    }
+        let slot = truth_engine::find_first_free_across(&streams, ws, we, min_duration_minutes);
 
-    let inputs: Vec<StreamInput> = serde_json::from_str(streams_json)
-        .map_err(|e| PyValueError::new_err(format!("Invalid streams JSON: {}", e)))?;
-
-    let ws = parse_dt(window_start)?;
-    let we = parse_dt(window_end)?;
-
-    let streams: Vec<EventStream> = inputs
-        .into_iter()
-        .map(|si| {
-            let events: PyResult<Vec<ExpandedEvent>> = si
-                .events
-                .into_iter()
-                .map(|ei| {
-                    let start = parse_dt(&ei.start)?;
-                    let end = parse_dt(&ei.end)?;
-                    Ok(ExpandedEvent { start, end })
-                })
-                .collect();
-            Ok(EventStream {
-                stream_id: si.stream_id,
-                events: events?,
-            })
-        })
-        .collect::<PyResult<Vec<_>>>()?;
-
-    let slot = truth_engine::find_first_free_across(&streams, ws, we, min_duration_minutes);
-
-    match slot {
-        Some(s) => serde_json::to_string(&s)
-            .map_err(|e| PyValueError::new_err(format!("Serialization error: {}", e))),
-        None => Ok("null".to_string()),
-    }
+        match slot {
+            Some(s) => serde_json::to_string(&s)
+                .map_err(|e| PyValueError::new_err(format!("Serialization error: {}", e))),
+            None => Ok("null".to_string()),
+        }
+    })
 }
 
 /// Convert a datetime to a different timezone representation.
@@ -349,8 +919,6 @@ fn adjust_timestamp(datetime: &str, adjustment: &str, timezone: &str) -> PyResul
 ///     ValueError: If the expression cannot be parsed or the timezone is invalid.
 #[pyfunction]
 fn resolve_relative(anchor: &str, expression: &str, timezone: &str) -> PyResult<String> {
-    use chrono::{DateTime, NaiveDateTime, Utc};
-
     let anchor_dt = if let Ok(dt) = DateTime::parse_from_rfc3339(anchor) {
         dt.with_timezone(&Utc)
     } else {
@@ -386,8 +954,6 @@ fn resolve_relative_with_options(
     timezone: &str,
     options_json: &str,
 ) -> PyResult<String> {
-    use chrono::{DateTime, NaiveDateTime, Utc};
-
     let anchor_dt = if let Ok(dt) = DateTime::parse_from_rfc3339(anchor) {
         dt.with_timezone(&Utc)
     } else {
@@ -420,15 +986,29 @@ fn resolve_relative_with_options(
 #[pymodule]
 fn _native(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(encode, m)?)?;
+    m.add_function(wrap_pyfunction!(clear_caches, m)?)?;
+    m.add_function(wrap_pyfunction!(set_caches_enabled, m)?)?;
     m.add_function(wrap_pyfunction!(decode, m)?)?;
+    m.add_function(wrap_pyfunction!(encode_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(decode_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(encode_many, m)?)?;
     m.add_function(wrap_pyfunction!(filter_and_encode, m)?)?;
+    m.add_function(wrap_pyfunction!(filter_and_encode_bytes, m)?)?;
     m.add_function(wrap_pyfunction!(expand_rrule, m)?)?;
+    m.add_function(wrap_pyfunction!(expand_rrule_bytes, m)?)?;
     m.add_function(wrap_pyfunction!(merge_availability, m)?)?;
+    m.add_function(wrap_pyfunction!(merge_availability_with_hint, m)?)?;
+    m.add_function(wrap_pyfunction!(merge_availability_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(merge_availability_many, m)?)?;
     m.add_function(wrap_pyfunction!(find_first_free_across, m)?)?;
     m.add_function(wrap_pyfunction!(convert_timezone, m)?)?;
     m.add_function(wrap_pyfunction!(compute_duration, m)?)?;
     m.add_function(wrap_pyfunction!(adjust_timestamp, m)?)?;
     m.add_function(wrap_pyfunction!(resolve_relative, m)?)?;
     m.add_function(wrap_pyfunction!(resolve_relative_with_options, m)?)?;
+    m.add_class::<FilterSet>()?;
+    m.add_class::<HintFlag>()?;
+    m.add("HINT_ENABLED", !cfg!(feature = "no-hint"))?;
+    m.add("_hint_flag", HintFlag::default())?;
     Ok(())
 }
@@ -7,11 +7,14 @@
 import json
 import logging
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from temporal_cortex_toon import (
-    decode, encode, expand_rrule, filter_and_encode,
+    FilterSet, decode, decode_bytes, encode, encode_bytes, encode_many, expand_rrule, expand_rrule_bytes,
+    filter_and_encode, filter_and_encode_bytes,
     convert_timezone, compute_duration, adjust_timestamp, resolve_relative,
 )
 import temporal_cortex_toon
@@ -68,6 +71,69 @@ def test_encode_string_with_spaces(self):
         result = encode('{"greeting":"hello world"}')
         assert "hello world" in result
 
+    def test_encode_from_threads(self):
+        # encode releases the GIL; concurrent callers must still get the
+        # same output as a single-threaded call.
+        payloads = [json.dumps({"id": i, "tags": ["a", "b"]}) for i in range(32)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(encode, payloads))
+        assert results == [encode(p) for p in payloads]
+
+    def test_encode_many_matches_encode(self):
+        payloads = [json.dumps({"id": i, "tags": ["a", "b"]}) for i in range(20)]
+        assert encode_many(payloads) == [encode(p) for p in payloads]
+        assert encode_many([]) == []
+
+    def test_encode_many_invalid_item_raises(self):
+        with pytest.raises(ValueError, match="item 1"):
+            encode_many(['{"a":1}', "{bad", '{"b":2}'])
+
+
+# ---------------------------------------------------------------------------
+# encode_bytes / decode_bytes
+# ---------------------------------------------------------------------------
+
+
+class TestBytes:
+    """Tests for the bytes-in, bytes-out codec entry points."""
+
+    def test_encode_bytes_matches_encode(self):
+        json_str = '{"name":"Alice","scores":[95,87,92]}'
+        assert encode_bytes(json_str.encode()) == encode(json_str).encode()
+
+    def test_decode_bytes_matches_decode(self):
+        toon = "name: Alice\nage: 30"
+        assert decode_bytes(toon.encode()) == decode(toon).encode()
+
+    def test_bytes_roundtrip_non_ascii(self):
+        original = '{"city":"Z\u00fcrich","note":"caf\u00e9"}'.encode()
+        assert json.loads(decode_bytes(encode_bytes(original))) == json.loads(original)
+
+    def test_filter_and_encode_bytes_matches_str(self):
+        json_str = '{"items":[{"name":"Event","etag":"x"}],"kind":"list"}'
+        patterns = ["kind", "*.etag"]
+        expected = filter_and_encode(json_str, patterns).encode()
+        assert filter_and_encode_bytes(json_str.encode(), patterns) == expected
+        assert FilterSet(patterns).apply_bytes(json_str.encode()) == expected
+
+    def test_encode_bytes_invalid_utf8_raises(self):
+        with pytest.raises(ValueError):
+            encode_bytes(b'{"x":"\xff"}')
+
+    def test_merge_availability_accepts_bytes(self):
+        streams = json.dumps([
+            {
+                "stream_id": "work",
+                "events": [
+                    {"start": "2026-03-17T09:00:00+00:00", "end": "2026-03-17T10:00:00+00:00"},
+                ],
+            },
+        ])
+        args = ("2026-03-17T08:00:00+00:00", "2026-03-17T18:00:00+00:00", False)
+        from_bytes = temporal_cortex_toon.merge_availability(streams.encode(), *args)
+        from_str = temporal_cortex_toon.merge_availability(streams, *args)
+        assert json.loads(from_bytes) == json.loads(from_str)
+
 
 # ---------------------------------------------------------------------------
 # decode
@@ -159,6 +225,34 @@ def test_filter_invalid_json_raises(self):
             filter_and_encode("bad json", ["field"])
 
 
+# ---------------------------------------------------------------------------
+# FilterSet
+# ---------------------------------------------------------------------------
+
+
+class TestFilterSet:
+    """Tests for the reusable FilterSet."""
+
+    def test_module_is_package(self):
+        assert FilterSet.__module__ == "temporal_cortex_toon"
+
+    def test_apply_matches_filter_and_encode(self):
+        json_str = '{"items":[{"name":"Event","etag":"x","kind":"event"}],"etag":"y"}'
+        patterns = ["etag", "*.etag", "*.kind"]
+        assert FilterSet(patterns).apply(json_str) == filter_and_encode(json_str, patterns)
+
+    def test_apply_is_reusable(self):
+        fs = FilterSet(["etag"])
+        first = fs.apply('{"name":"Alice","etag":"abc"}')
+        second = fs.apply('{"name":"Bob","etag":"def"}')
+        assert first == "name: Alice"
+        assert second == "name: Bob"
+
+    def test_apply_invalid_json_raises(self):
+        with pytest.raises(ValueError):
+            FilterSet(["etag"]).apply("bad json")
+
+
 # ---------------------------------------------------------------------------
 # expand_rrule
 # ---------------------------------------------------------------------------
@@ -250,6 +344,99 @@ def test_expand_weekly(self):
         delta = (end - start).total_seconds()
         assert delta == 45 * 60
 
+    def test_expand_as_list_matches_json(self):
+        args = ("FREQ=WEEKLY;COUNT=4;BYDAY=MO", "2026-02-16T09:00:00", 45, "America/New_York")
+        events = expand_rrule(*args, as_json=False)
+        assert isinstance(events, list)
+        assert events == json.loads(expand_rrule(*args))
+
+    def test_expand_repeated_call_respects_every_argument(self):
+        # Results are cached per argument tuple; changing any one must not hit
+        # another call's entry.
+        base = ("FREQ=DAILY;COUNT=5", "2026-02-17T14:00:00", 60, "UTC")
+        assert expand_rrule(*base) == expand_rrule(*base)
+        assert len(json.loads(expand_rrule(*base, None, 2))) == 2
+        assert len(json.loads(expand_rrule(*base, "2026-02-18T23:59:59"))) == 2
+        shifted = json.loads(expand_rrule("FREQ=DAILY;COUNT=5", "2026-02-17T14:00:00", 30, "UTC"))
+        assert shifted[0]["end"] == "2026-02-17T14:30:00+00:00"
+
+    def test_expand_bytes_matches_json(self):
+        args = ("FREQ=WEEKLY;COUNT=4;BYDAY=MO", "2026-02-16T09:00:00", 45, "America/New_York")
+        events = json.loads(expand_rrule(*args))
+        buf = expand_rrule_bytes(*args)
+        assert isinstance(buf, bytes)
+        assert len(buf) == 16 * len(events)
+
+        from datetime import datetime
+        pairs = struct.unpack(f"<{2 * len(events)}q", buf)
+        for i, event in enumerate(events):
+            start = datetime.fromisoformat(event["start"])
+            end = datetime.fromisoformat(event["end"])
+            assert pairs[2 * i] == int(start.timestamp()) * 1_000_000_000
+            assert pairs[2 * i + 1] == int(end.timestamp()) * 1_000_000_000
+
+    def test_expand_bytes_invalid_rrule_raises(self):
+        with pytest.raises(ValueError):
+            expand_rrule_bytes("", "2026-02-17T14:00:00", 60, "UTC")
+
+
+# ---------------------------------------------------------------------------
+# merge_availability
+# ---------------------------------------------------------------------------
+
+
+class TestMergeAvailability:
+    """Tests for single-window availability merging."""
+
+    WINDOW = ("2026-03-17T08:00:00+00:00", "2026-03-17T18:00:00+00:00")
+
+    def test_no_streams_leaves_window_free(self):
+        result = json.loads(temporal_cortex_toon.merge_availability(" [] ", *self.WINDOW))
+        assert result["busy"] == []
+        assert len(result["free"]) == 1
+        assert result["free"][0]["duration_minutes"] == 600
+
+    def test_non_json_whitespace_around_empty_streams_raises(self):
+        with pytest.raises(ValueError):
+            temporal_cortex_toon.merge_availability("\u00a0[]", *self.WINDOW)
+
+    def test_results_unchanged_with_caches_cleared_or_disabled(self):
+        payload = json.dumps([{
+            "stream_id": "work",
+            "events": [{"start": "2026-03-17T09:00:00+00:00", "end": "2026-03-17T10:00:00+00:00"}],
+        }])
+        expected = temporal_cortex_toon.merge_availability(payload, *self.WINDOW)
+        temporal_cortex_toon.clear_caches()
+        assert temporal_cortex_toon.merge_availability(payload, *self.WINDOW) == expected
+        temporal_cortex_toon.set_caches_enabled(False)
+        try:
+            for _ in range(2):
+                assert temporal_cortex_toon.merge_availability(payload, *self.WINDOW) == expected
+        finally:
+            temporal_cortex_toon.set_caches_enabled(True)
+
+    def test_many_distinct_payloads_survive_cache_eviction(self):
+        # More distinct payloads than the parsed-streams cache holds (8), each
+        # merged twice: evicted and re-parsed entries must still be correct.
+        payloads = [
+            json.dumps([{
+                "stream_id": f"cal-{i}",
+                "events": [{
+                    "start": f"2026-03-17T{8 + i % 10:02d}:00:00+00:00",
+                    "end": f"2026-03-17T{8 + i % 10:02d}:30:00+00:00",
+                }],
+            }])
+            for i in range(12)
+        ]
+        for _ in range(2):
+            for i, payload in enumerate(payloads):
+                result = json.loads(
+                    temporal_cortex_toon.merge_availability(payload, *self.WINDOW)
+                )
+                assert [b["start"][:19] for b in result["busy"]] == [
+                    f"2026-03-17T{8 + i % 10:02d}:00:00"
+                ]
+
 
 # ---------------------------------------------------------------------------
 # merge_availability hint
@@ -259,32 +446,64 @@ def test_expand_weekly(self):
 class TestMergeAvailabilityHint:
     """Tests for the 3+ stream contextual hint in merge_availability."""
 
-    @staticmethod
-    def _make_streams(n: int) -> str:
-        """Build N empty event streams as a JSON string."""
-        streams = [{"stream_id": f"cal-{i}", "events": []} for i in range(n)]
-        return json.dumps(streams)
+    # N empty event streams as JSON, built once for the whole class.
+    _STREAMS_2 = json.dumps([{"stream_id": f"cal-{i}", "events": []} for i in range(2)])
+    _STREAMS_3 = json.dumps([{"stream_id": f"cal-{i}", "events": []} for i in range(3)])
+    _STREAMS_4 = json.dumps([{"stream_id": f"cal-{i}", "events": []} for i in range(4)])
+    _STREAMS_5 = json.dumps([{"stream_id": f"cal-{i}", "events": []} for i in range(5)])
 
     def test_hint_fires_on_3_streams(self, caplog):
-        temporal_cortex_toon._hint_shown = False
         os.environ.pop("TEMPORAL_CORTEX_QUIET", None)
+        temporal_cortex_toon._reset_hint()
 
         with caplog.at_level(logging.INFO, logger="temporal_cortex_toon"):
             temporal_cortex_toon.merge_availability(
-                self._make_streams(3),
+                self._STREAMS_3,
                 "2026-03-17T08:00:00+00:00",
                 "2026-03-18T00:00:00+00:00",
                 True,
             )
         assert "app.temporal-cortex.com" in caplog.text
 
+    def test_hint_record_carries_component(self, caplog):
+        os.environ.pop("TEMPORAL_CORTEX_QUIET", None)
+        temporal_cortex_toon._reset_hint()
+
+        with caplog.at_level(logging.INFO, logger="temporal_cortex_toon"):
+            temporal_cortex_toon.merge_availability(
+                self._STREAMS_3,
+                "2026-03-17T08:00:00+00:00",
+                "2026-03-18T00:00:00+00:00",
+                True,
+            )
+        records = [r for r in caplog.records if r.name == "temporal_cortex_toon"]
+        assert len(records) == 1
+        assert records[0].component == "merge_hint"
+
     def test_hint_does_not_fire_on_2_streams(self, caplog):
-        temporal_cortex_toon._hint_shown = False
         os.environ.pop("TEMPORAL_CORTEX_QUIET", None)
+        temporal_cortex_toon._reset_hint()
 
         with caplog.at_level(logging.INFO, logger="temporal_cortex_toon"):
             temporal_cortex_toon.merge_availability(
-                self._make_streams(2),
+                self._STREAMS_2,
+                "2026-03-17T08:00:00+00:00",
+                "2026-03-18T00:00:00+00:00",
+                True,
+            )
+        assert "app.temporal-cortex.com" not in caplog.text
+
+    def test_hint_ignores_braces_inside_strings(self, caplog):
+        os.environ.pop("TEMPORAL_CORTEX_QUIET", None)
+        temporal_cortex_toon._reset_hint()
+        streams = json.dumps([
+            {"stream_id": '{"a": {}, "b": [{}]}', "events": []},
+            {"stream_id": 'cal-\\"{', "events": []},
+        ])
+
+        with caplog.at_level(logging.INFO, logger="temporal_cortex_toon"):
+            temporal_cortex_toon.merge_availability(
+                streams,
                 "2026-03-17T08:00:00+00:00",
                 "2026-03-18T00:00:00+00:00",
                 True,
@@ -292,19 +511,19 @@ def test_hint_does_not_fire_on_2_streams(self, caplog):
         assert "app.temporal-cortex.com" not in caplog.text
 
     def test_hint_fires_only_once(self, caplog):
-        temporal_cortex_toon._hint_shown = False
         os.environ.pop("TEMPORAL_CORTEX_QUIET", None)
+        temporal_cortex_toon._reset_hint()
 
         with caplog.at_level(logging.INFO, logger="temporal_cortex_toon"):
             temporal_cortex_toon.merge_availability(
-                self._make_streams(4),
+                self._STREAMS_4,
                 "2026-03-17T08:00:00+00:00",
                 "2026-03-18T00:00:00+00:00",
                 True,
             )
             first_count = caplog.text.count("app.temporal-cortex.com")
             temporal_cortex_toon.merge_availability(
-                self._make_streams(5),
+                self._STREAMS_5,
                 "2026-03-17T08:00:00+00:00",
                 "2026-03-18T00:00:00+00:00",
                 True,
@@ -312,13 +531,13 @@ def test_hint_fires_only_once(self, caplog):
         assert caplog.text.count("app.temporal-cortex.com") == first_count
 
     def test_hint_suppressed_by_env_var(self, caplog):
-        temporal_cortex_toon._hint_shown = False
         os.environ["TEMPORAL_CORTEX_QUIET"] = "1"
+        temporal_cortex_toon._reset_hint()
 
         try:
             with caplog.at_level(logging.INFO, logger="temporal_cortex_toon"):
                 temporal_cortex_toon.merge_availability(
-                    self._make_streams(3),
+                    self._STREAMS_3,
                     "2026-03-17T08:00:00+00:00",
                     "2026-03-18T00:00:00+00:00",
                     True,
@@ -326,6 +545,58 @@ def test_hint_suppressed_by_env_var(self, caplog):
             assert "app.temporal-cortex.com" not in caplog.text
         finally:
             os.environ.pop("TEMPORAL_CORTEX_QUIET", None)
+            temporal_cortex_toon._refresh_quiet()
+
+
+# ---------------------------------------------------------------------------
+# merge_availability_many
+# ---------------------------------------------------------------------------
+
+
+class TestMergeAvailabilityMany:
+    """Tests for batched availability merging across several windows."""
+
+    STREAMS = json.dumps([
+        {
+            "stream_id": "work",
+            "events": [
+                {"start": "2026-03-17T09:00:00+00:00", "end": "2026-03-17T10:00:00+00:00"},
+                {"start": "2026-03-18T13:00:00+00:00", "end": "2026-03-18T14:00:00+00:00"},
+            ],
+        },
+        {
+            "stream_id": "personal",
+            "events": [
+                {"start": "2026-03-17T12:00:00+00:00", "end": "2026-03-17T13:00:00+00:00"},
+            ],
+        },
+    ])
+    WINDOWS = [
+        ("2026-03-17T08:00:00+00:00", "2026-03-17T18:00:00+00:00"),
+        ("2026-03-18T08:00:00+00:00", "2026-03-18T18:00:00+00:00"),
+        ("2026-03-19T08:00:00+00:00", "2026-03-19T18:00:00+00:00"),
+    ]
+
+    def test_returns_one_result_per_window(self):
+        results = temporal_cortex_toon.merge_availability_many(self.STREAMS, self.WINDOWS)
+        assert len(results) == len(self.WINDOWS)
+
+    def test_matches_single_window_calls(self):
+        results = temporal_cortex_toon.merge_availability_many(
+            self.STREAMS, self.WINDOWS, False
+        )
+        for (start, end), result in zip(self.WINDOWS, results):
+            single = temporal_cortex_toon.merge_availability(self.STREAMS, start, end, False)
+            assert json.loads(result) == json.loads(single)
+
+    def test_empty_windows_returns_empty_list(self):
+        assert temporal_cortex_toon.merge_availability_many(self.STREAMS, []) == []
+
+    def test_invalid_window_raises(self):
+        with pytest.raises(ValueError):
+            temporal_cortex_toon.merge_availability_many(
+                self.STREAMS, [("not-a-date", "2026-03-17T18:00:00+00:00")]
+            )
 
 
 # ---------------------------------------------------------------------------
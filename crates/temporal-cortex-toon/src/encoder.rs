@@ -23,6 +23,7 @@
 
 use crate::error::Result;
 use serde_json::Value;
+use std::fmt::Write;
 
 /// Encode a JSON string into TOON v3.0 format.
 ///
@@ -30,15 +31,48 @@
 /// representation. Returns an error if the input is not valid JSON.
 pub fn encode(json: &str) -> Result<String> {
     let value: Value = serde_json::from_str(json)?;
+    Ok(encode_value(&value))
+}
+
+/// Encode a JSON string into TOON v3.0 format, appending to `out`.
+///
+/// Same as [`encode`], but lets callers reuse one buffer across many calls
+/// instead of allocating a fresh `String` each time. On error `out` is left
+/// unchanged.
+pub fn encode_into(json: &str, out: &mut String) -> Result<()> {
+    let value: Value = serde_json::from_str(json)?;
+    encode_root(&value, out);
+    Ok(())
+}
+
+/// Encode UTF-8 JSON bytes into TOON v3.0 format.
+///
+/// Same as [`encode`], but parses straight from the byte slice: UTF-8 is
+/// checked inside string tokens as the parser reaches them, so callers holding
+/// raw bytes (e.g., an HTTP body) skip a separate validation pass.
+pub fn encode_slice(json: &[u8]) -> Result<String> {
+    let value: Value = serde_json::from_slice(json)?;
+    Ok(encode_value(&value))
+}
+
+/// Encode an already-parsed JSON value into TOON v3.0 format.
+///
+/// Use this when the value is at hand (e.g., after filtering) to avoid
+/// serializing it back to a JSON string just for [`encode`] to re-parse it.
+/// Encoding a `Value` cannot fail.
+pub fn encode_value(value: &Value) -> String {
     let mut out = String::new();
-    encode_root(&value, &mut out);
-    Ok(out)
+    encode_root(value, &mut out);
+    out
 }
 
 /// Top-level dispatch: objects emit fields, arrays emit root array syntax,
 /// primitives emit a bare value.
 fn encode_root(value: &Value, out: &mut String) {
     match value {
+        Value::Object(map) if map.values().all(is_primitive) => {
+            encode_flat_object(map, out);
+        }
         Value::Object(map) => {
             encode_object_fields(map, 0, out);
         }
@@ -51,15 +85,31 @@ fn encode_root(value: &Value, out: &mut String) {
     }
 }
 
+/// Fast path for the most common payload shape: a root object whose values
+/// are all primitives. Each field is a single `key: value` line at depth 0,
+/// so this skips indentation and per-field type dispatch.
+fn encode_flat_object(map: &serde_json::Map<String, Value>, out: &mut String) {
+    for (i, (key, value)) in map.iter().enumerate() {
+        if i > 0 {
+            out.push('\n');
+        }
+        push_key(key, out);
+        out.push_str(": ");
+        encode_primitive_value(value, QuoteContext::Document, out);
+    }
+}
+
 /// Encode a root-level array. Primitive arrays use inline syntax `[N]: v1,v2`;
 /// mixed/complex arrays use expanded list syntax `[N]:\n  - item`.
 fn encode_root_array(arr: &[Value], out: &mut String) {
     let len = arr.len();
     if all_primitives(arr) {
-        out.push_str(&format!("[{}]: ", len));
+        write_len(len, out);
+        out.push_str(": ");
         encode_inline_values(arr, out);
     } else {
-        out.push_str(&format!("[{}]:", len));
+        write_len(len, out);
+        out.push(':');
         encode_list_items(arr, 0, out);
     }
 }
@@ -70,15 +120,14 @@ fn encode_root_array(arr: &[Value], out: &mut String) {
 /// Relies on `serde_json::Map` with `preserve_order` feature to maintain
 /// the original JSON insertion order (IndexMap, not BTreeMap).
 fn encode_object_fields(map: &serde_json::Map<String, Value>, depth: usize, out: &mut String) {
-    let indent = make_indent(depth);
     let mut first = true;
     for (key, value) in map {
         if !first {
             out.push('\n');
         }
         first = false;
-        out.push_str(&indent);
-        out.push_str(&encode_key(key));
+        push_indent(depth, out);
+        push_key(key, out);
         encode_field_value(key, value, depth, out);
     }
 }
@@ -119,26 +168,37 @@ fn encode_array_field(arr: &[Value], depth: usize, out: &mut String) {
     let len = arr.len();
 
     if arr.is_empty() {
-        out.push_str(&format!("[{}]:", len));
+        write_len(len, out);
+        out.push(':');
         return;
     }
 
     // Tabular: uniform object arrays (greatest compression for repetitive data)
     if let Some(fields) = detect_tabular(arr) {
-        out.push_str(&format!("[{}]{{{}}}:", len, fields.join(",")));
+        write_len(len, out);
+        out.push('{');
+        for (i, field) in fields.iter().enumerate() {
+            if i > 0 {
+                out.push(',');
+            }
+            out.push_str(field);
+        }
+        out.push_str("}:");
         encode_tabular_rows(arr, &fields, depth, out);
         return;
     }
 
     // Inline: all-primitive arrays on a single line
     if all_primitives(arr) {
-        out.push_str(&format!("[{}]: ", len));
+        write_len(len, out);
+        out.push_str(": ");
         encode_inline_values(arr, out);
         return;
     }
 
     // Expanded: complex/mixed arrays with "- " list markers
-    out.push_str(&format!("[{}]:", len));
+    write_len(len, out);
+    out.push(':');
     encode_list_items(arr, depth, out);
 }
 
@@ -156,10 +216,9 @@ fn encode_inline_values(arr: &[Value], out: &mut String) {
 /// Emit tabular rows: each object's values as a comma-separated line, no keys repeated.
 /// Quoting uses `TabularCell` context (comma triggers quoting, not colon).
 fn encode_tabular_rows(arr: &[Value], fields: &[String], depth: usize, out: &mut String) {
-    let row_indent = make_indent(depth + 1);
     for obj_val in arr {
         out.push('\n');
-        out.push_str(&row_indent);
+        push_indent(depth + 1, out);
         if let Value::Object(map) = obj_val {
             for (i, field) in fields.iter().enumerate() {
                 if i > 0 {
@@ -178,10 +237,9 @@ fn encode_tabular_rows(arr: &[Value], fields: &[String], depth: usize, out: &mut
 /// - An object: `- key1: val1\n    key2: val2` (first field on hyphen line)
 /// - A nested array: `- [N]: v1,v2`
 fn encode_list_items(arr: &[Value], depth: usize, out: &mut String) {
-    let item_indent = make_indent(depth + 1);
     for item in arr {
         out.push('\n');
-        out.push_str(&item_indent);
+        push_indent(depth + 1, out);
         out.push_str("- ");
         match item {
             Value::Object(map) => {
@@ -190,14 +248,13 @@ fn encode_list_items(arr: &[Value], depth: usize, out: &mut String) {
                 for (key, value) in map {
                     if first {
                         first = false;
-                        out.push_str(&encode_key(key));
+                        push_key(key, out);
                         encode_list_item_field_value(value, depth + 1, out);
                     } else {
                         out.push('\n');
                         // Sibling fields at same depth as "- " content
-                        out.push_str(&make_indent(depth + 1));
-                        out.push_str("  ");
-                        out.push_str(&encode_key(key));
+                        push_indent(depth + 2, out);
+                        push_key(key, out);
                         encode_list_item_field_value(value, depth + 1, out);
                     }
                 }
@@ -206,10 +263,12 @@ fn encode_list_items(arr: &[Value], depth: usize, out: &mut String) {
                 // Nested array as list item
                 let len = inner_arr.len();
                 if all_primitives(inner_arr) {
-                    out.push_str(&format!("[{}]: ", len));
+                    write_len(len, out);
+                    out.push_str(": ");
                     encode_inline_values(inner_arr, out);
                 } else {
-                    out.push_str(&format!("[{}]:", len));
+                    write_len(len, out);
+                    out.push(':');
                     encode_list_items(inner_arr, depth + 1, out);
                 }
             }
@@ -232,15 +291,14 @@ fn encode_list_item_field_value(value: &Value, depth: usize, out: &mut String) {
             out.push(':');
             out.push('\n');
             // Nested object inside a list item: depth + 1 extra for the "- " offset
-            let nested_indent = make_indent(depth + 2);
             let mut first = true;
             for (key, val) in map {
                 if !first {
                     out.push('\n');
                 }
                 first = false;
-                out.push_str(&nested_indent);
-                out.push_str(&encode_key(key));
+                push_indent(depth + 2, out);
+                push_key(key, out);
                 encode_field_value(key, val, depth + 2, out);
             }
         }
@@ -272,46 +330,50 @@ fn encode_primitive_value(value: &Value, ctx: QuoteContext, out: &mut String) {
     match value {
         Value::Null => out.push_str("null"),
         Value::Bool(b) => out.push_str(if *b { "true" } else { "false" }),
-        Value::Number(n) => out.push_str(&format_number(n)),
+        Value::Number(n) => write_number(n, out),
         Value::String(s) => encode_string_value(s, ctx, out),
         _ => out.push_str("null"), // arrays/objects in primitive context
     }
 }
 
-/// Format a JSON number per TOON v3.0 rules:
+/// Append an array length marker: `[N]`.
+fn write_len(len: usize, out: &mut String) {
+    out.push('[');
+    out.push_str(itoa::Buffer::new().format(len));
+    out.push(']');
+}
+
+/// Append a JSON number per TOON v3.0 rules:
 /// - No scientific notation (exponents)
 /// - No leading zeros (except 0.x)
 /// - No trailing fractional zeros (3.10 → 3.1)
 /// - Negative zero normalizes to 0
-fn format_number(n: &serde_json::Number) -> String {
+///
+/// Writes straight into `out`: integers go through `itoa`, and floats use
+/// `Display`, whose shortest round-trip digits never include an exponent or
+/// trailing zeros (unlike Ryū, which switches to `1e-7` style at the extremes).
+fn write_number(n: &serde_json::Number, out: &mut String) {
     if let Some(i) = n.as_i64() {
-        return i.to_string();
+        out.push_str(itoa::Buffer::new().format(i));
+        return;
     }
     if let Some(u) = n.as_u64() {
-        return u.to_string();
+        out.push_str(itoa::Buffer::new().format(u));
+        return;
     }
-    if let Some(f) = n.as_f64() {
-        if f.is_nan() || f.is_infinite() {
-            return "null".to_string();
-        }
-        // Normalize -0 to 0
-        let f = if f == 0.0 { 0.0 } else { f };
-        // Check if it's a whole number
-        if f.fract() == 0.0 && f.abs() < (i64::MAX as f64) {
-            return (f as i64).to_string();
-        }
-        // Format without trailing zeros
-        let s = format!("{}", f);
-        // Remove trailing zeros after decimal point
-        if s.contains('.') {
-            let trimmed = s.trim_end_matches('0');
-            let trimmed = trimmed.trim_end_matches('.');
-            trimmed.to_string()
-        } else {
-            s
+    match n.as_f64() {
+        Some(f) if f.is_finite() => {
+            // Normalize -0 to 0
+            let f = if f == 0.0 { 0.0 } else { f };
+            // Check if it's a whole number
+            if f.fract() == 0.0 && f.abs() < (i64::MAX as f64) {
+                out.push_str(itoa::Buffer::new().format(f as i64));
+            } else {
+                // Writing to a String cannot fail.
+                let _ = write!(out, "{}", f);
+            }
         }
-    } else {
-        "null".to_string()
+        _ => out.push_str("null"),
     }
 }
 
@@ -319,23 +381,55 @@ fn format_number(n: &serde_json::Number) -> String {
 /// Unquoted strings save 2 tokens (the quotes) per value — significant at scale.
 fn encode_string_value(s: &str, ctx: QuoteContext, out: &mut String) {
     if needs_quoting(s, ctx) {
-        out.push('"');
-        for ch in s.chars() {
-            match ch {
-                '\\' => out.push_str("\\\\"),
-                '"' => out.push_str("\\\""),
-                '\n' => out.push_str("\\n"),
-                '\r' => out.push_str("\\r"),
-                '\t' => out.push_str("\\t"),
-                _ => out.push(ch),
-            }
-        }
-        out.push('"');
+        push_quoted(s, out);
     } else {
         out.push_str(s);
     }
 }
 
+/// Emit `s` in double quotes with escape sequences. Runs of characters that
+/// need no escaping are copied as whole slices rather than char by char.
+fn push_quoted(s: &str, out: &mut String) {
+    out.push('"');
+    let mut clean_from = 0;
+    for (i, b) in s.bytes().enumerate() {
+        let escape = match b {
+            b'\\' => "\\\\",
+            b'"' => "\\\"",
+            b'\n' => "\\n",
+            b'\r' => "\\r",
+            b'\t' => "\\t",
+            _ => continue,
+        };
+        // `b` is ASCII, so `i` is a char boundary.
+        out.push_str(&s[clean_from..i]);
+        out.push_str(escape);
+        clean_from = i + 1;
+    }
+    out.push_str(&s[clean_from..]);
+    out.push('"');
+}
+
+/// Byte classes for [`needs_quoting`]: bytes that always force quoting, and
+/// the delimiters that force it only in some contexts.
+const QUOTE_ALWAYS: u8 = 1;
+const QUOTE_IN_DOCUMENT: u8 = 2;
+const QUOTE_IN_ARRAY: u8 = 4;
+
+/// Class of every byte value. Non-ASCII bytes (UTF-8 sequences) are never special.
+static QUOTE_CLASS: [u8; 256] = {
+    let mut table = [0u8; 256];
+    let always = b"\\\"[]{}\n\r\t";
+    let mut i = 0;
+    while i < always.len() {
+        table[always[i] as usize] = QUOTE_ALWAYS;
+        i += 1;
+    }
+    table[b':' as usize] = QUOTE_IN_DOCUMENT;
+    table[b',' as usize] = QUOTE_IN_ARRAY;
+    table
+};
+
 /// Determine if a string value must be quoted to preserve TOON roundtrip fidelity.
 ///
 /// A string MUST be quoted if it:
@@ -353,50 +447,31 @@ fn needs_quoting(s: &str, ctx: QuoteContext) -> bool {
     if s.is_empty() {
         return true;
     }
-    // Leading or trailing whitespace
-    if s != s.trim() {
+    // Leading or trailing whitespace (Unicode-aware, as `str::trim`)
+    if s.starts_with(char::is_whitespace) || s.ends_with(char::is_whitespace) {
         return true;
     }
     // Looks like bool or null
     if s == "true" || s == "false" || s == "null" {
         return true;
     }
-    // Looks like a number (including leading-zero forms like "05")
-    if looks_numeric(s) {
-        return true;
-    }
-    // Contains backslash or double quote
-    if s.contains('\\') || s.contains('"') {
-        return true;
-    }
-    // Contains brackets or braces
-    if s.contains('[') || s.contains(']') || s.contains('{') || s.contains('}') {
-        return true;
-    }
-    // Contains control characters
-    if s.contains('\n') || s.contains('\r') || s.contains('\t') {
-        return true;
-    }
     // Starts with hyphen (could be confused with list item marker "- ")
     if s.starts_with('-') {
         return true;
     }
-    // Context-dependent delimiter quoting
-    match ctx {
-        QuoteContext::Document => {
-            // Colon triggers quoting in document context
-            if s.contains(':') {
-                return true;
-            }
-        }
-        QuoteContext::InlineArray | QuoteContext::TabularCell => {
-            // Active delimiter (comma by default) triggers quoting
-            if s.contains(',') {
-                return true;
-            }
-        }
+    // Backslash, double quote, brackets, braces, control characters, or the
+    // context's active delimiter -- colon in document context, comma (the
+    // active delimiter) in inline arrays and tabular cells -- in one pass.
+    let mask = QUOTE_ALWAYS
+        | match ctx {
+            QuoteContext::Document => QUOTE_IN_DOCUMENT,
+            QuoteContext::InlineArray | QuoteContext::TabularCell => QUOTE_IN_ARRAY,
+        };
+    if s.bytes().any(|b| QUOTE_CLASS[b as usize] & mask != 0) {
+        return true;
     }
-    false
+    // Looks like a number (including leading-zero forms like "05")
+    looks_numeric(s)
 }
 
 /// Check if a string looks like a number (and thus must be quoted to preserve type info).
@@ -436,26 +511,13 @@ fn looks_numeric(s: &str) -> bool {
     rest.as_bytes().iter().any(|b| b.is_ascii_digit())
 }
 
-/// Encode an object key. Keys matching `^[A-Za-z_][A-Za-z0-9_.]*$` are emitted
+/// Emit an object key. Keys matching `^[A-Za-z_][A-Za-z0-9_.]*$` are emitted
 /// unquoted; all others are quoted with escape sequences.
-fn encode_key(key: &str) -> String {
+fn push_key(key: &str, out: &mut String) {
     if is_valid_unquoted_key(key) {
-        key.to_string()
+        out.push_str(key);
     } else {
-        let mut out = String::with_capacity(key.len() + 2);
-        out.push('"');
-        for ch in key.chars() {
-            match ch {
-                '\\' => out.push_str("\\\\"),
-                '"' => out.push_str("\\\""),
-                '\n' => out.push_str("\\n"),
-                '\r' => out.push_str("\\r"),
-                '\t' => out.push_str("\\t"),
-                _ => out.push(ch),
-            }
-        }
-        out.push('"');
-        out
+        push_quoted(key, out);
     }
 }
 
@@ -509,10 +571,24 @@ fn detect_tabular(arr: &[Value]) -> Option<Vec<String>> {
 
 /// Check if all array elements are primitives (not objects or arrays).
 fn all_primitives(arr: &[Value]) -> bool {
-    arr.iter().all(|v| !v.is_object() && !v.is_array())
+    arr.iter().all(is_primitive)
 }
 
-/// Generate a 2-space-per-level indentation string.
-fn make_indent(depth: usize) -> String {
-    "  ".repeat(depth)
+/// Check if a value is a primitive (not an object or array).
+fn is_primitive(value: &Value) -> bool {
+    !value.is_object() && !value.is_array()
+}
+
+/// Whitespace slab that indentation is sliced from.
+const SPACES: &str = "                                                                                                                                ";
+
+/// Append 2-space-per-level indentation, copied from [`SPACES`] rather than
+/// built per call.
+fn push_indent(depth: usize, out: &mut String) {
+    let mut width = depth * 2;
+    while width > SPACES.len() {
+        out.push_str(SPACES);
+        width -= SPACES.len();
+    }
+    out.push_str(&SPACES[..width]);
 }
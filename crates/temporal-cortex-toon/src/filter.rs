@@ -19,16 +19,112 @@
 ///
 /// Each segment is either a literal field name or the wildcard `*`.
 /// For example, `"items.*.etag"` becomes `["items", "*", "etag"]`.
-#[derive(Debug, Clone)]
+///
+/// Segments are borrowed, so narrowing a pattern while descending is just
+/// re-slicing. Only used for patterns too long for a [`Program`].
+#[derive(Debug, Clone, Copy)]
 struct Pattern<'a> {
-    segments: Vec<&'a str>,
+    segments: &'a [String],
+}
+
+/// Split a dot-separated pattern string into segments.
+fn split_pattern(pattern: &str) -> Vec<&str> {
+    pattern.split('.').collect()
+}
+
+/// Number of pattern suffixes one [`Program`] can track: one bit each in a `u64`.
+const PROGRAM_BITS: usize = 64;
+
+/// Patterns compiled into bitmasks.
+///
+/// Every suffix of every pattern gets one bit (`"items.*.etag"` has three:
+/// itself, `"*.etag"` and `"etag"`), numbered so that a suffix's tail is the
+/// next bit up. The suffixes still in play at some depth then form a single
+/// `u64`, and matching a key against all of them takes one lookup plus a few
+/// mask operations instead of a string comparison per pattern.
+#[derive(Debug, Clone, Default)]
+struct Program {
+    /// Suffixes of whole patterns: the live set at the root.
+    roots: u64,
+    /// Single-segment suffixes; matching one removes the key.
+    terminal: u64,
+    /// Suffixes starting with `*`.
+    wildcard: u64,
+    /// Distinct literal segments, each with the suffixes starting with it.
+    literals: Vec<(String, u64)>,
+    /// Bits in use.
+    len: usize,
 }
 
-impl<'a> Pattern<'a> {
-    /// Parse a dot-separated pattern string into segments.
-    fn parse(pattern: &'a str) -> Self {
-        Self {
-            segments: pattern.split('.').collect(),
+impl Program {
+    /// Add a pattern's suffixes. The caller ensures they fit in the mask.
+    fn push(&mut self, segments: &[&str]) {
+        for (i, &segment) in segments.iter().enumerate() {
+            let bit = 1u64 << (self.len + i);
+            if i == 0 {
+                self.roots |= bit;
+            }
+            if i + 1 == segments.len() {
+                self.terminal |= bit;
+            }
+            if segment == "*" {
+                self.wildcard |= bit;
+            } else if let Some((_, mask)) = self.literals.iter_mut().find(|(s, _)| s == segment) {
+                *mask |= bit;
+            } else {
+                self.literals.push((segment.to_string(), bit));
+            }
+        }
+        self.len += segments.len();
+    }
+
+    /// Suffixes whose first segment equals `key` as a literal string.
+    fn named(&self, key: &str) -> u64 {
+        // A key literally called `*` also equals the wildcard segments.
+        let wildcard = if key == "*" { self.wildcard } else { 0 };
+        self.literals
+            .iter()
+            .find(|(s, _)| s == key)
+            .map_or(wildcard, |&(_, mask)| mask | wildcard)
+    }
+
+    /// Match `key` against the `live` suffixes, following the rules described
+    /// on [`apply_filter`]. Returns `None` if the key is removed, otherwise
+    /// the suffixes live inside its value.
+    fn step(&self, live: u64, key: &str) -> Option<u64> {
+        let named = self.named(key);
+        // Literal suffixes naming this key.
+        let literal = live & named & !self.wildcard;
+        // Wildcard suffixes, and the suffix right after each of them.
+        let wild = live & self.wildcard;
+        let after_wild = (wild & !self.terminal) << 1;
+
+        if (literal | wild | (after_wild & named)) & self.terminal != 0 {
+            return None;
+        }
+        let matched = literal | (after_wild & (named | self.wildcard));
+        Some(((matched & !self.terminal) << 1) | wild)
+    }
+
+    /// Strip matching fields from `value`, given the suffixes `live` at its depth.
+    fn run(&self, value: &mut Value, live: u64) {
+        match value {
+            Value::Object(map) => map.retain(|key, child| match self.step(live, key) {
+                None => false,
+                Some(next) => {
+                    if next != 0 {
+                        self.run(child, next);
+                    }
+                    true
+                }
+            }),
+            // Arrays are transparent: each element sees the same suffixes.
+            Value::Array(arr) => {
+                for elem in arr {
+                    self.run(elem, live);
+                }
+            }
+            _ => {}
         }
     }
 }
@@ -37,7 +133,8 @@ fn parse(pattern: &'a str) -> Self {
 ///
 /// Returns a new `Value` with matching fields removed. The function
 /// recursively walks objects and arrays, applying pattern matching at
-/// each level.
+/// each level. [`filter_and_encode`] filters its freshly parsed value in
+/// place instead, so nothing is copied.
 ///
 /// # Pattern syntax
 ///
@@ -57,14 +154,104 @@ fn parse(pattern: &'a str) -> Self {
 /// assert_eq!(filtered, json!({"name": "Alice"}));
 /// ```
 pub fn filter_fields(value: &Value, patterns: &[&str]) -> Value {
-    if patterns.is_empty() {
-        return value.clone();
+    FilterSet::new(patterns).filter(value)
+}
+
+/// A reusable set of filter patterns, parsed once.
+///
+/// [`filter_fields`] and [`filter_and_encode`] compile their pattern strings
+/// on every call. A `FilterSet` does that once up front, which pays off in
+/// sync loops that apply the same patterns to many API responses.
+///
+/// # Examples
+///
+/// ```
+/// use toon_core::FilterSet;
+///
+/// let filter = FilterSet::new(&["etag", "*.kind"]);
+/// let toon = filter.filter_and_encode(r#"{"name":"Alice","etag":"abc"}"#).unwrap();
+/// assert_eq!(toon, "name: Alice");
+/// ```
+#[derive(Debug, Clone)]
+pub struct FilterSet {
+    /// Compiled patterns, at most [`PROGRAM_BITS`] suffixes per program.
+    programs: Vec<Program>,
+    /// Patterns with more segments than a program can hold.
+    long: Vec<Vec<String>>,
+}
+
+impl FilterSet {
+    /// Compile `patterns` (same syntax as [`filter_fields`]) into a reusable set.
+    pub fn new(patterns: &[&str]) -> Self {
+        let mut programs: Vec<Program> = Vec::new();
+        let mut long = Vec::new();
+        for pattern in patterns {
+            let segments = split_pattern(pattern);
+            if segments.len() > PROGRAM_BITS {
+                long.push(segments.into_iter().map(String::from).collect());
+                continue;
+            }
+            // Removals from separate programs compose, so a full program can
+            // simply be followed by another.
+            match programs.last_mut() {
+                Some(program) if program.len + segments.len() <= PROGRAM_BITS => {
+                    program.push(&segments)
+                }
+                _ => {
+                    let mut program = Program::default();
+                    program.push(&segments);
+                    programs.push(program);
+                }
+            }
+        }
+        Self { programs, long }
+    }
+
+    /// Strip matching fields from a JSON value. See [`filter_fields`].
+    pub fn filter(&self, value: &Value) -> Value {
+        let mut value = value.clone();
+        self.filter_in_place(&mut value);
+        value
+    }
+
+    /// Strip matching fields from an owned value, without copying it.
+    fn filter_in_place(&self, value: &mut Value) {
+        for program in &self.programs {
+            program.run(value, program.roots);
+        }
+        if !self.long.is_empty() {
+            let parsed: Vec<Pattern<'_>> =
+                self.long.iter().map(|s| Pattern { segments: s }).collect();
+            apply_filter(value, &parsed);
+        }
+    }
+
+    /// Filter a JSON string, then encode the result to TOON. See [`filter_and_encode`].
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if the input is not valid JSON or if TOON encoding fails.
+    pub fn filter_and_encode(&self, json: &str) -> Result<String> {
+        let mut value: Value = serde_json::from_str(json)?;
+        self.filter_in_place(&mut value);
+        Ok(crate::encoder::encode_value(&value))
+    }
+
+    /// Same as [`FilterSet::filter_and_encode`], but parses UTF-8 JSON bytes
+    /// directly (see [`crate::encode_slice`]).
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if the input is not valid UTF-8 JSON or if TOON encoding fails.
+    pub fn filter_and_encode_slice(&self, json: &[u8]) -> Result<String> {
+        let mut value: Value = serde_json::from_slice(json)?;
+        self.filter_in_place(&mut value);
+        Ok(crate::encoder::encode_value(&value))
     }
-    let parsed: Vec<Pattern<'_>> = patterns.iter().map(|p| Pattern::parse(p)).collect();
-    apply_filter(value, &parsed)
 }
 
-/// Internal recursive filter engine.
+/// Reference recursive filter engine, used for patterns too long for a
+/// [`Program`] (whose `step` applies the same rules with bitmasks).
 ///
 /// Walks the value tree, applying all active patterns at the current depth.
 /// For each object key, patterns are checked in three ways:
@@ -79,33 +266,32 @@ pub fn filter_fields(value: &Value, patterns: &[&str]) -> Value {
 ///
 /// Arrays are transparent to pattern matching: all patterns pass through
 /// to each array element unchanged.
-fn apply_filter(value: &Value, patterns: &[Pattern<'_>]) -> Value {
+fn apply_filter(value: &mut Value, patterns: &[Pattern<'_>]) {
     match value {
         Value::Object(map) => filter_object(map, patterns),
         Value::Array(arr) => filter_array(arr, patterns),
-        // Primitives (string, number, bool, null) are returned as-is.
-        other => other.clone(),
+        // Primitives (string, number, bool, null) are left as-is.
+        _ => {}
     }
 }
 
 /// Filter an object map by removing keys that match terminal patterns,
 /// and recursing into children with narrowed patterns.
-fn filter_object(map: &Map<String, Value>, patterns: &[Pattern<'_>]) -> Value {
-    let mut result = Map::new();
-
-    for (key, child) in map {
+fn filter_object(map: &mut Map<String, Value>, patterns: &[Pattern<'_>]) {
+    // `retain` keeps the surviving keys in their original order.
+    map.retain(|key, child| {
         // Determine whether this key should be removed and collect
         // the set of patterns to propagate into the child value.
         let mut remove = false;
         let mut child_patterns: Vec<Pattern<'_>> = Vec::new();
 
         for pattern in patterns {
-            let segs = &pattern.segments;
+            let segs = pattern.segments;
             if segs.is_empty() {
                 continue;
             }
 
-            let first = segs[0];
+            let first = segs[0].as_str();
             let rest = &segs[1..];
 
             if first == "*" {
@@ -117,22 +303,22 @@ fn filter_object(map: &Map<String, Value>, patterns: &[Pattern<'_>]) -> Value {
                 }
                 // The wildcard consumed one level. Check if the remaining
                 // pattern's first segment matches this key as a terminal.
-                if rest.len() == 1 && rest[0] == key {
+                if rest.len() == 1 && rest[0].as_str() == key {
                     // e.g. pattern `*.etag` and key is `etag` -- remove it.
                     remove = true;
                     break;
                 }
                 // Otherwise, narrow the rest as a child pattern if the next
                 // segment matches this key or is another wildcard.
-                if rest[0] == key || rest[0] == "*" {
+                if rest[0].as_str() == key || rest[0].as_str() == "*" {
                     // Descend with segments after the matched key.
                     child_patterns.push(Pattern {
-                        segments: rest[1..].to_vec(),
+                        segments: &rest[1..],
                     });
                 }
                 // Always propagate the full wildcard pattern into children
                 // so it can match at deeper levels too.
-                child_patterns.push(pattern.clone());
+                child_patterns.push(*pattern);
             } else if first == key {
                 // Literal match on the first segment.
                 if rest.is_empty() {
@@ -141,27 +327,22 @@ fn filter_object(map: &Map<String, Value>, patterns: &[Pattern<'_>]) -> Value {
                     break;
                 }
                 // Multi-segment: descend with the remaining path.
-                child_patterns.push(Pattern {
-                    segments: rest.to_vec(),
-                });
+                child_patterns.push(Pattern { segments: rest });
             }
             // If first segment doesn't match and isn't `*`, this pattern
             // doesn't apply at this key -- skip it.
         }
 
         if remove {
-            continue;
+            return false;
         }
 
         // Recurse into the child with the narrowed pattern set.
-        if child_patterns.is_empty() {
-            result.insert(key.clone(), child.clone());
-        } else {
-            result.insert(key.clone(), apply_filter(child, &child_patterns));
+        if !child_patterns.is_empty() {
+            apply_filter(child, &child_patterns);
         }
-    }
-
-    Value::Object(result)
+        true
+    });
 }
 
 /// Filter array elements by passing all patterns through to each element.
@@ -169,19 +350,17 @@ fn filter_object(map: &Map<String, Value>, patterns: &[Pattern<'_>]) -> Value {
 /// Arrays are "transparent" to pattern matching -- they don't consume
 /// any pattern segments. This means `"items.etag"` works correctly when
 /// `items` is an array: the pattern descends into each array element.
-fn filter_array(arr: &[Value], patterns: &[Pattern<'_>]) -> Value {
-    Value::Array(
-        arr.iter()
-            .map(|elem| apply_filter(elem, patterns))
-            .collect(),
-    )
+fn filter_array(arr: &mut [Value], patterns: &[Pattern<'_>]) {
+    for elem in arr {
+        apply_filter(elem, patterns);
+    }
 }
 
 /// Filter JSON fields by pattern, then encode the result to TOON.
 ///
 /// This is a convenience function combining [`filter_fields`] with
-/// [`crate::encode`]. The JSON string is parsed, filtered, re-serialized
-/// to JSON, and then encoded to TOON.
+/// [`crate::encode`]. The JSON string is parsed once, filtered in place,
+/// and the resulting value is encoded to TOON directly.
 ///
 /// # Errors
 ///
@@ -197,10 +376,7 @@ fn filter_array(arr: &[Value], patterns: &[Pattern<'_>]) -> Value {
 /// assert_eq!(toon, "name: Alice");
 /// ```
 pub fn filter_and_encode(json: &str, patterns: &[&str]) -> Result<String> {
-    let value: Value = serde_json::from_str(json)?;
-    let filtered = filter_fields(&value, patterns);
-    let filtered_json = serde_json::to_string(&filtered)?;
-    crate::encoder::encode(&filtered_json)
+    FilterSet::new(patterns).filter_and_encode(json)
 }
 
 /// Predefined filter sets for common calendar APIs.
@@ -26,7 +26,7 @@
 //!
 //! - [`encoder`] — JSON string → TOON string
 //! - [`decoder`] — TOON string → JSON string
-//! - [`filter`] — Semantic filtering + TOON encode (`filter_and_encode`, `CalendarFilter`)
+//! - [`filter`] — Semantic filtering + TOON encode (`filter_and_encode`, `FilterSet`, `CalendarFilter`)
 //! - [`error`] — Error types for parse/encode failures
 //! - [`types`] — `ToonValue` AST (reserved for future direct-manipulation use)
 
@@ -37,6 +37,6 @@
 pub mod types;
 
 pub use decoder::decode;
-pub use encoder::encode;
+pub use encoder::{encode, encode_into, encode_slice, encode_value};
 pub use error::ToonError;
-pub use filter::{filter_and_encode, filter_fields, CalendarFilter};
+pub use filter::{filter_and_encode, filter_fields, CalendarFilter, FilterSet};
@@ -4,7 +4,7 @@
 /// is implemented. All tests should FAIL initially (encoder returns todo!()).
 ///
 /// Spec reference: TOON v3.0 (2025-11-24) — github.com/toon-format/spec
-use toon_core::encode;
+use toon_core::{encode, encode_into, encode_slice, encode_value};
 
 // ============================================================================
 // Primitives
@@ -280,6 +280,15 @@ fn encode_deeply_nested_object() {
     assert_eq!(toon, expected);
 }
 
+#[test]
+fn encode_indentation_beyond_64_levels() {
+    let depth = 100;
+    let json = format!("{}\"v\"{}", r#"{"k":"#.repeat(depth), "}".repeat(depth));
+    let toon = encode(&json).unwrap();
+    let last = toon.lines().last().unwrap();
+    assert_eq!(last, format!("{}k: v", "  ".repeat(depth - 1)));
+}
+
 #[test]
 fn encode_mixed_nested_flat() {
     let json = r#"{"name":"App","server":{"host":"localhost","port":8080},"debug":true}"#;
@@ -476,6 +485,16 @@ fn encode_objects_with_nested_values_not_tabular() {
     assert_eq!(toon, expected);
 }
 
+#[test]
+fn encode_flat_scalar_object() {
+    let json = r#"{"a":1,"b":"x y","c":null,"d":true,"e":"1","my key":"v:w"}"#;
+    let toon = encode(json).unwrap();
+    assert_eq!(
+        toon,
+        "a: 1\nb: x y\nc: null\nd: true\ne: \"1\"\n\"my key\": \"v:w\""
+    );
+}
+
 #[test]
 fn encode_no_trailing_newline() {
     // Spec: No trailing newline at end of document
@@ -524,3 +543,42 @@ fn encode_tabular_datetime_no_extra_quotes() {
     let expected = "events[1]{time,name}:\n  10:30:00,meeting";
     assert_eq!(toon, expected);
 }
+
+// ============================================================================
+// Byte-slice input
+// ============================================================================
+
+#[test]
+fn encode_slice_matches_encode() {
+    let json = r#"{"users":[{"id":1,"name":"Alice"},{"id":2,"name":"Bob"}],"tags":["a","b"]}"#;
+    assert_eq!(
+        encode_slice(json.as_bytes()).unwrap(),
+        encode(json).unwrap()
+    );
+}
+
+#[test]
+fn encode_slice_rejects_invalid_utf8() {
+    assert!(encode_slice(b"{\"name\":\"\xff\"}").is_err());
+}
+
+#[test]
+fn encode_value_matches_encode() {
+    let json = r#"{"name":"Alice","scores":[95,87,92]}"#;
+    let value: serde_json::Value = serde_json::from_str(json).unwrap();
+    assert_eq!(encode_value(&value), encode(json).unwrap());
+}
+
+#[test]
+fn encode_into_appends_and_reuses_buffer() {
+    let mut out = String::new();
+    encode_into(r#"{"a":1}"#, &mut out).unwrap();
+    assert_eq!(out, encode(r#"{"a":1}"#).unwrap());
+
+    out.clear();
+    encode_into(r#"[1,2]"#, &mut out).unwrap();
+    assert_eq!(out, "[2]: 1,2");
+
+    assert!(encode_into("not json", &mut out).is_err());
+    assert_eq!(out, "[2]: 1,2");
+}
@@ -5,7 +5,7 @@
 ///
 /// The filter module strips unnecessary fields from JSON before TOON encoding,
 /// reducing token consumption for LLM processing of calendar data.
-use toon_core::{encode, filter_and_encode, filter_fields, CalendarFilter};
+use toon_core::{encode, filter_and_encode, filter_fields, CalendarFilter, FilterSet};
 
 // ============================================================================
 // Helper: Realistic Google Calendar-like JSON fixtures
@@ -562,3 +562,101 @@ fn filter_deep_nested_with_arrays_and_objects() {
         "location.name should be preserved"
     );
 }
+
+// ============================================================================
+// 11. Reusable FilterSet
+// ============================================================================
+
+#[test]
+fn filter_set_matches_filter_and_encode() {
+    let patterns = CalendarFilter::google_default();
+    let filter = FilterSet::new(&patterns);
+
+    for json in [
+        single_event_json(),
+        calendar_list_json(),
+        deep_nested_json(),
+    ] {
+        assert_eq!(
+            filter.filter_and_encode(json).unwrap(),
+            filter_and_encode(json, &patterns).unwrap()
+        );
+    }
+}
+
+#[test]
+fn filter_set_is_reusable_across_inputs() {
+    let filter = FilterSet::new(&["etag", "*.etag"]);
+
+    let first = filter.filter_and_encode(flat_json()).unwrap();
+    let second = filter.filter_and_encode(deep_nested_json()).unwrap();
+
+    assert!(!first.contains("etag"));
+    assert!(!second.contains("etag"));
+    assert!(second.contains("keep-me"));
+}
+
+#[test]
+fn filter_set_filter_matches_filter_fields() {
+    let value: serde_json::Value = serde_json::from_str(calendar_list_json()).unwrap();
+    let patterns = ["items.attendees.responseStatus", "*.kind"];
+
+    assert_eq!(
+        FilterSet::new(&patterns).filter(&value),
+        filter_fields(&value, &patterns)
+    );
+}
+
+#[test]
+fn filter_set_empty_preserves_all() {
+    let filter = FilterSet::new(&[]);
+    assert_eq!(
+        filter.filter_and_encode(flat_json()).unwrap(),
+        encode(flat_json()).unwrap()
+    );
+}
+
+#[test]
+fn filter_set_invalid_json_returns_error() {
+    let filter = FilterSet::new(&["etag"]);
+    assert!(filter.filter_and_encode("not json").is_err());
+}
+
+#[test]
+fn filter_set_many_patterns() {
+    // More pattern segments than fit in one compiled program (64).
+    let names: Vec<String> = (0..40).map(|i| format!("*.field{i}")).collect();
+    let mut patterns: Vec<&str> = names.iter().map(String::as_str).collect();
+    patterns.push("etag");
+    let value = serde_json::json!({"etag": "x", "a": {"field0": 1, "field39": 2, "keep": 3}});
+
+    assert_eq!(
+        FilterSet::new(&patterns).filter(&value),
+        serde_json::json!({"a": {"keep": 3}})
+    );
+}
+
+#[test]
+fn filter_set_very_long_pattern() {
+    // A single pattern longer than a compiled program still matches.
+    let pattern = format!("{}z", "a.".repeat(70));
+    let mut value = serde_json::json!({"z": 1, "keep": 2});
+    let mut expected = serde_json::json!({"keep": 2});
+    for _ in 0..70 {
+        value = serde_json::json!({ "a": value });
+        expected = serde_json::json!({ "a": expected });
+    }
+
+    assert_eq!(FilterSet::new(&["etag", &pattern]).filter(&value), expected);
+}
+
+#[test]
+fn filter_set_slice_matches_str() {
+    let set = FilterSet::new(&["etag", "*.kind"]);
+    let json = r#"{"items":[{"name":"Z\u00fcrich","kind":"event","etag":"x"}],"etag":"y"}"#;
+    assert_eq!(
+        set.filter_and_encode_slice(json.as_bytes()).unwrap(),
+        set.filter_and_encode(json).unwrap()
+    );
+    assert!(set.filter_and_encode_slice(b"{\"a\":\"\xff\"}").is_err());
+}
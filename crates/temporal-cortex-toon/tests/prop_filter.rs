@@ -0,0 +1,132 @@
+/// Differential Property Tests for Semantic Filtering
+///
+/// `filter_fields` and `FilterSet` compile patterns into bitmask programs.
+/// These tests check them against `reference_filter`, a direct port of the
+/// original segment-by-segment recursive engine, on random values and
+/// pattern sets.
+///
+/// Strategies draw keys and pattern segments from one small alphabet that
+/// includes a literal `*` key and the empty key, so patterns match often
+/// and wildcard/literal interactions are exercised. Pattern sets reach 40
+/// patterns so they span several 64-segment programs.
+use proptest::prelude::*;
+use serde_json::{Map, Value};
+use toon_core::{filter_fields, FilterSet};
+
+// ============================================================================
+// Reference engine
+// ============================================================================
+
+/// Strip fields matching `patterns` the way the original recursive engine did.
+fn reference_filter(value: &Value, patterns: &[&str]) -> Value {
+    let split: Vec<Vec<&str>> = patterns.iter().map(|p| p.split('.').collect()).collect();
+    let parsed: Vec<&[&str]> = split.iter().map(Vec::as_slice).collect();
+    let mut value = value.clone();
+    reference_apply(&mut value, &parsed);
+    value
+}
+
+fn reference_apply(value: &mut Value, patterns: &[&[&str]]) {
+    match value {
+        Value::Object(map) => reference_object(map, patterns),
+        Value::Array(arr) => {
+            for elem in arr {
+                reference_apply(elem, patterns);
+            }
+        }
+        _ => {}
+    }
+}
+
+fn reference_object(map: &mut Map<String, Value>, patterns: &[&[&str]]) {
+    map.retain(|key, child| {
+        let mut child_patterns: Vec<&[&str]> = Vec::new();
+        for &segs in patterns {
+            let Some((&first, rest)) = segs.split_first() else {
+                continue;
+            };
+            if first == "*" {
+                if rest.is_empty() || (rest.len() == 1 && rest[0] == key) {
+                    return false;
+                }
+                if rest[0] == key || rest[0] == "*" {
+                    child_patterns.push(&rest[1..]);
+                }
+                child_patterns.push(segs);
+            } else if first == key {
+                if rest.is_empty() {
+                    return false;
+                }
+                child_patterns.push(rest);
+            }
+        }
+        if !child_patterns.is_empty() {
+            reference_apply(child, &child_patterns);
+        }
+        true
+    });
+}
+
+// ============================================================================
+// Strategies
+// ============================================================================
+
+/// Keys and pattern segments share this alphabet.
+const NAMES: &[&str] = &["a", "b", "c", "etag", "*", ""];
+
+fn arb_name() -> impl Strategy<Value = String> {
+    prop::sample::select(NAMES).prop_map(String::from)
+}
+
+/// Random JSON value: objects and arrays up to 4 levels deep.
+fn arb_value() -> impl Strategy<Value = Value> {
+    let leaf = prop_oneof![
+        Just(Value::Null),
+        any::<bool>().prop_map(Value::Bool),
+        (0i64..100).prop_map(Value::from),
+        "[a-z]{0,3}".prop_map(Value::String),
+    ];
+    leaf.prop_recursive(4, 64, 6, |inner| {
+        prop_oneof![
+            prop::collection::vec(inner.clone(), 0..4).prop_map(Value::Array),
+            prop::collection::vec((arb_name(), inner), 0..6)
+                .prop_map(|fields| Value::Object(fields.into_iter().collect())),
+        ]
+    })
+}
+
+/// A dot-separated pattern of 1-4 segments.
+fn arb_pattern() -> impl Strategy<Value = String> {
+    prop::collection::vec(arb_name(), 1..5).prop_map(|segs| segs.join("."))
+}
+
+// ============================================================================
+// Property Tests
+// ============================================================================
+
+proptest! {
+    #![proptest_config(ProptestConfig::with_cases(2000))]
+
+    /// `filter_fields` removes exactly what the reference engine removes.
+    #[test]
+    fn filter_fields_matches_reference(
+        value in arb_value(),
+        patterns in prop::collection::vec(arb_pattern(), 0..40),
+    ) {
+        let refs: Vec<&str> = patterns.iter().map(String::as_str).collect();
+        prop_assert_eq!(filter_fields(&value, &refs), reference_filter(&value, &refs));
+    }
+
+    /// A reused `FilterSet` agrees with the reference engine.
+    #[test]
+    fn filter_set_matches_reference(
+        values in prop::collection::vec(arb_value(), 1..4),
+        patterns in prop::collection::vec(arb_pattern(), 0..40),
+    ) {
+        let refs: Vec<&str> = patterns.iter().map(String::as_str).collect();
+        let set = FilterSet::new(&refs);
+        for value in &values {
+            prop_assert_eq!(set.filter(value), reference_filter(value, &refs));
+        }
+    }
+}
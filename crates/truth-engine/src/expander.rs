@@ -4,7 +4,7 @@
 //! of RFC 5545 recurrence rules with correct DST handling.
 
 use crate::error::{Result, TruthError};
-use chrono::{DateTime, Duration, Utc};
+use chrono::{DateTime, Datelike, Duration, NaiveDateTime, Utc};
 use rrule::RRuleSet;
 
 /// A single expanded event instance with start and end times.
@@ -87,6 +87,14 @@ pub fn expand_rrule_with_exdates(
         .parse()
         .map_err(|_| TruthError::InvalidTimezone(timezone.to_string()))?;
 
+    let duration = Duration::minutes(duration_minutes as i64);
+
+    if timezone == "UTC" && exdates.is_empty() {
+        if let Some(events) = expand_fixed_step_utc(rrule, dtstart, duration, until, count) {
+            return Ok(events);
+        }
+    }
+
     // Convert the dtstart from "2026-02-17T14:00:00" to iCalendar format "20260217T140000".
     let dtstart_ical = dtstart.replace(['-', ':'], "");
 
@@ -142,10 +150,9 @@ pub fn expand_rrule_with_exdates(
     let exdate_buffer = exdates.len() as u16;
     let max_count: u16 = count
         .map(|c| (c as u16).saturating_add(exdate_buffer))
-        .unwrap_or(500);
+        .unwrap_or(DEFAULT_MAX_COUNT);
 
     let instances = rrule_set.all(max_count);
-    let duration = Duration::minutes(duration_minutes as i64);
 
     let mut events: Vec<ExpandedEvent> = instances
         .dates
@@ -168,3 +175,103 @@ pub fn expand_rrule_with_exdates(
 
     Ok(events)
 }
+
+/// Instances expanded when neither the rule nor the caller sets a count.
+const DEFAULT_MAX_COUNT: u16 = 500;
+
+/// Format of `dtstart` / `until` accepted by [`expand_fixed_step_utc`].
+const LOCAL_DATETIME_FORMAT: &str = "%Y-%m-%dT%H:%M:%S";
+
+/// Last year the `rrule` crate expands into.
+const MAX_YEAR: i32 = 9999;
+
+/// Expand the simplest recurring rules without the `rrule` crate.
+///
+/// Handles `FREQ=DAILY` and `FREQ=WEEKLY` with only `INTERVAL` and `COUNT`
+/// parts, in UTC, without EXDATEs, and with either a count or `until` but
+/// not both. There each occurrence is exactly
+/// `INTERVAL` days (or weeks) after the previous one, so expansion is one
+/// addition per instance instead of building and iterating an `RRuleSet`.
+///
+/// Returns `None` for anything else -- including input the `rrule` crate
+/// should validate or reject -- so the caller falls back to the general path.
+fn expand_fixed_step_utc(
+    rrule: &str,
+    dtstart: &str,
+    duration: Duration,
+    until: Option<&str>,
+    count: Option<u32>,
+) -> Option<Vec<ExpandedEvent>> {
+    let mut step_days: Option<i64> = None;
+    let mut interval: Option<u16> = None;
+    let mut rule_count: Option<u32> = None;
+    for part in rrule.split(';') {
+        let (key, value) = part.split_once('=')?;
+        let repeated = match key {
+            "FREQ" => {
+                let days = match value {
+                    "DAILY" => 1,
+                    "WEEKLY" => 7,
+                    _ => return None,
+                };
+                step_days.replace(days).is_some()
+            }
+            "INTERVAL" => {
+                let n: u16 = value.parse().ok().filter(|&n| n > 0)?;
+                interval.replace(n).is_some()
+            }
+            "COUNT" => {
+                let n: u32 = value.parse().ok().filter(|&n| n > 0)?;
+                rule_count.replace(n).is_some()
+            }
+            _ => return None,
+        };
+        if repeated {
+            return None;
+        }
+    }
+    // RFC 5545 forbids COUNT together with UNTIL and the rrule crate rejects
+    // the pair, so that error must come from the general path.
+    if until.is_some() && (rule_count.is_some() || count.is_some()) {
+        return None;
+    }
+    // Counts past `u16` are truncated differently on the general path.
+    let count_limit = u32::from(u16::MAX);
+    if rule_count.into_iter().chain(count).any(|c| c > count_limit) {
+        return None;
+    }
+    let step = Duration::days(step_days? * i64::from(interval.unwrap_or(1)));
+
+    let start = NaiveDateTime::parse_from_str(dtstart, LOCAL_DATETIME_FORMAT).ok()?;
+    if !(1..=MAX_YEAR).contains(&start.year()) {
+        return None;
+    }
+    let until = match until {
+        Some(u) => Some(NaiveDateTime::parse_from_str(u, LOCAL_DATETIME_FORMAT).ok()?),
+        None => None,
+    };
+    if until.is_some_and(|u| u < start) {
+        return None;
+    }
+
+    // Same cap as the general path: a COUNT in the rule wins over the caller's
+    // `count`, the result is cut to `count`, and (counts being at most
+    // `u16::MAX`) the `as u16` cast matches what is passed to `RRuleSet::all`.
+    let max_count = count.map_or(DEFAULT_MAX_COUNT, |c| c as u16);
+    let limit = rule_count
+        .into_iter()
+        .chain(count)
+        .fold(u32::from(max_count), u32::min) as usize;
+
+    let mut events = Vec::with_capacity(limit.min(usize::from(DEFAULT_MAX_COUNT)));
+    let mut current = start;
+    while events.len() < limit && current.year() <= MAX_YEAR && until.is_none_or(|u| current <= u) {
+        let start_utc = current.and_utc();
+        events.push(ExpandedEvent {
+            start: start_utc,
+            end: start_utc + duration,
+        });
+        current = current.checked_add_signed(step)?;
+    }
+    Some(events)
+}
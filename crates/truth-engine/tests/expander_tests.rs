@@ -307,3 +307,68 @@ fn duration_applied_correctly() {
         Utc.with_ymd_and_hms(2026, 3, 1, 10, 30, 0).unwrap()
     );
 }
+
+// ---------------------------------------------------------------------------
+// Fixed-step UTC rules (expanded without the rrule crate)
+// ---------------------------------------------------------------------------
+
+#[test]
+fn weekly_interval_two_utc() {
+    let result = expand_rrule(
+        "FREQ=WEEKLY;INTERVAL=2",
+        "2026-03-01T09:00:00",
+        30,
+        "UTC",
+        None,
+        Some(3),
+    )
+    .expect("should expand");
+
+    let starts: Vec<_> = result.iter().map(|e| e.start).collect();
+    assert_eq!(
+        starts,
+        vec![
+            Utc.with_ymd_and_hms(2026, 3, 1, 9, 0, 0).unwrap(),
+            Utc.with_ymd_and_hms(2026, 3, 15, 9, 0, 0).unwrap(),
+            Utc.with_ymd_and_hms(2026, 3, 29, 9, 0, 0).unwrap(),
+        ]
+    );
+}
+
+#[test]
+fn fixed_step_utc_matches_rrule_crate() {
+    // "Etc/UTC" has the same offsets as "UTC" but always goes through the
+    // rrule crate, so the two must agree instance for instance.
+    let cases: [(&str, Option<&str>, Option<u32>); 6] = [
+        ("FREQ=DAILY", None, None),
+        ("FREQ=DAILY;COUNT=3", None, Some(10)),
+        ("FREQ=DAILY;COUNT=30", None, Some(10)),
+        ("FREQ=DAILY;INTERVAL=3", Some("2026-04-01T09:00:00"), None),
+        ("FREQ=WEEKLY", Some("2026-06-30T23:59:59"), None),
+        ("FREQ=WEEKLY;INTERVAL=4;COUNT=7", None, None),
+    ];
+    for (rule, until, count) in cases {
+        let fast = expand_rrule(rule, "2026-03-01T09:00:00", 45, "UTC", until, count)
+            .expect("should expand");
+        let general = expand_rrule(rule, "2026-03-01T09:00:00", 45, "Etc/UTC", until, count)
+            .expect("should expand");
+        assert_eq!(fast, general, "{rule} until={until:?} count={count:?}");
+    }
+}
+
+#[test]
+fn utc_count_with_until_matches_rrule_crate() {
+    // COUNT together with UNTIL is left to the rrule crate, so "UTC" must give
+    // the same result -- success or error -- as any other zone.
+    let cases: [(&str, Option<u32>); 3] = [
+        ("FREQ=WEEKLY", Some(5)),
+        ("FREQ=DAILY;COUNT=3", None),
+        ("FREQ=DAILY;COUNT=3", Some(10)),
+    ];
+    for (rule, count) in cases {
+        let until = Some("2026-06-30T23:59:59");
+        let utc = expand_rrule(rule, "2026-03-01T09:00:00", 45, "UTC", until, count);
+        let etc = expand_rrule(rule, "2026-03-01T09:00:00", 45, "Etc/UTC", until, count);
+        assert_eq!(utc.ok(), etc.ok(), "{rule} count={count:?}");
+    }
+}
@@ -0,0 +1,61 @@
+#!/usr/bin/env bash
+# Build a profile-guided (PGO) release wheel of the Python bindings.
+#
+#   1. Build an instrumented wheel and install it into a throwaway virtualenv.
+#   2. Run train.py there to record branch profiles on representative payloads.
+#   3. Merge the profiles and build the release wheel with -Cprofile-use.
+#
+# The instrumented build never touches your own environment, so a failed run
+# cannot leave behind an extension that writes .profraw files on every import.
+#
+# train.py varies the RRULE start date on every expand_rrule call so the
+# bindings' expansion cache always misses; otherwise the profile would see
+# the expansion path only once per rule and treat it as cold.
+#
+# Requires maturin on PATH and llvm-profdata matching rustc's LLVM
+# (`rustup component add llvm-tools-preview`). Set PYTHON to choose the
+# interpreter the training environment is built from (default: python3).
+#
+# Extra RUSTFLAGS are kept, e.g. for a per-microarchitecture wheel:
+#   RUSTFLAGS="-Ctarget-cpu=x86-64-v3" scripts/pgo/build.sh
+# Arguments are passed through to the final `maturin build`.
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+CRATE="$ROOT/crates/temporal-cortex-toon-python"
+PROFILE_DIR="${PGO_PROFILE_DIR:-$ROOT/target/pgo-profiles}"
+BASE_RUSTFLAGS="${RUSTFLAGS:-}"
+PYTHON="${PYTHON:-python3}"
+
+PROFDATA="$(command -v llvm-profdata || true)"
+if [ -z "$PROFDATA" ]; then
+    PROFDATA="$(find "$(rustc --print sysroot)" -name llvm-profdata -type f | head -n 1)"
+fi
+if [ -z "$PROFDATA" ]; then
+    echo "llvm-profdata not found; run: rustup component add llvm-tools-preview" >&2
+    exit 1
+fi
+
+WORK="$(mktemp -d)"
+trap 'rm -rf "$WORK"' EXIT
+
+rm -rf "$PROFILE_DIR"
+mkdir -p "$PROFILE_DIR"
+cd "$CRATE"
+
+echo "==> Building instrumented wheel"
+RUSTFLAGS="$BASE_RUSTFLAGS -Cprofile-generate=$PROFILE_DIR" \
+    maturin build --release --interpreter "$PYTHON" --out "$WORK/wheels"
+
+echo "==> Installing into a throwaway virtualenv"
+"$PYTHON" -m venv "$WORK/venv"
+"$WORK/venv/bin/python" -m pip install --quiet --no-index "$WORK"/wheels/*.whl
+
+echo "==> Running training workload"
+"$WORK/venv/bin/python" "$ROOT/scripts/pgo/train.py"
+
+echo "==> Merging profiles"
+"$PROFDATA" merge -o "$PROFILE_DIR/merged.profdata" "$PROFILE_DIR"
+
+echo "==> Building optimized wheel"
+RUSTFLAGS="$BASE_RUSTFLAGS -Cprofile-use=$PROFILE_DIR/merged.profdata" maturin build --release "$@"
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""PGO training workload for the temporal_cortex_toon extension.
+
+Run against an instrumented build (see build.sh). Exercises the hot
+encode / decode / filter / RRULE paths with the payload shapes used in
+the Python test suite, so the recorded branch profile matches real usage.
+
+Usage:
+    python train.py [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+from temporal_cortex_toon import (
+    FilterSet,
+    decode,
+    encode,
+    encode_many,
+    expand_rrule,
+    filter_and_encode,
+)
+
+# ---------------------------------------------------------------------------
+# Payloads
+# ---------------------------------------------------------------------------
+
+SIMPLE = '{"name":"Alice","age":30,"active":true,"note":null}'
+
+NESTED = json.dumps({
+    "user": {"name": "Bob", "active": True, "address": {"city": "Zürich", "zip": "8001"}},
+    "scores": [95, 87, 92],
+    "tags": ["a", "b, c", ""],
+})
+
+EVENTS = json.dumps({
+    "kind": "calendar#events",
+    "etag": '"p33c9"',
+    "items": [
+        {
+            "id": f"evt{i}",
+            "etag": f'"{i}"',
+            "summary": f"Meeting {i}",
+            "start": {"dateTime": "2026-03-17T09:00:00-07:00"},
+            "end": {"dateTime": "2026-03-17T10:00:00-07:00"},
+            "attendees": [{"email": "a@example.com"}, {"email": "b@example.com"}],
+        }
+        for i in range(20)
+    ],
+})
+
+RECORDS = json.dumps([
+    {"id": i, "name": f"Room {i}", "capacity": 4 + i, "price": 12.5 * i}
+    for i in range(50)
+])
+
+PAYLOADS = [SIMPLE, NESTED, EVENTS, RECORDS]
+
+FILTER_PATTERNS = ["etag", "kind", "*.etag", "items.attendees"]
+
+# (rrule, start time of day, duration, timezone, until, max_count); the start
+# date is varied per round, see train().
+RRULES = [
+    ("FREQ=DAILY;COUNT=30", "14:00:00", 60, "UTC", None, None),
+    ("FREQ=WEEKLY;INTERVAL=2", "14:00:00", 30, "UTC", "2026-12-31T23:59:59", None),
+    ("FREQ=WEEKLY;BYDAY=TU,TH", "14:00:00", 60, "America/Los_Angeles",
+     "2026-06-30T23:59:59", None),
+    ("FREQ=MONTHLY;BYDAY=-1FR", "09:00:00", 45, "Europe/London", None, 24),
+]
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def train(rounds: int) -> None:
+    filter_set = FilterSet(FILTER_PATTERNS)
+    toons = [encode(p) for p in PAYLOADS]
+    for i in range(rounds):
+        for payload, toon in zip(PAYLOADS, toons):
+            encode(payload)
+            decode(toon)
+            filter_and_encode(payload, FILTER_PATTERNS)
+            filter_set.apply(payload)
+        encode_many(PAYLOADS)
+        # expand_rrule caches its last 32 results by exact arguments, so
+        # repeating the same calls would profile the expansion only once.
+        # Cycling through more distinct start dates than the cache holds
+        # makes every call a miss.
+        day = 1 + i % 28
+        for rrule, time, duration, tz, until, count in RRULES:
+            expand_rrule(rrule, f"2026-01-{day:02d}T{time}", duration, tz, until, count)
+            expand_rrule(rrule, f"2026-03-{day:02d}T{time}", duration, tz, until, count,
+                         as_json=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000, help="workload repetitions")
+    train(parser.parse_args().rounds)
+
+
+if __name__ == "__main__":
+    main()